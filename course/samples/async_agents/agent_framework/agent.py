@@ -9,8 +9,17 @@ This agent demonstrates:
 Try asking: "Check the deployment status of our web app and address any issues"
 """
 
+import asyncio
+import functools
+import json
 import os
+import re
+import shutil
+import stat
 import subprocess
+import threading
+import time
+import weakref
 from collections.abc import Awaitable, Callable
 from typing import Annotated
 
@@ -28,47 +37,95 @@ from agent_framework import (
 from agent_framework.azure import AzureOpenAIChatClient
 
 
+# Terms that cause a request to be rejected before it reaches the LLM
+BLOCKED_TERMS: tuple[str, ...] = ("password", "secret", "api_key", "token")
+
+# Longer user messages are rejected without being scanned
+MAX_MESSAGE_CHARS = 100_000
+
+try:
+    import ahocorasick  # pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+# One automaton matches every blocked term in a single pass over the text
+_BLOCKED_AUTOMATON = None
+if ahocorasick is not None:
+    _BLOCKED_AUTOMATON = ahocorasick.Automaton()
+    for _term in BLOCKED_TERMS:
+        _BLOCKED_AUTOMATON.add_word(_term, _term)
+    _BLOCKED_AUTOMATON.make_automaton()
+
+# Fallback without the C extension: a single case-insensitive alternation,
+# searched directly on the original text with no lowercased copy
+_BLOCKED_RE = re.compile("|".join(re.escape(term) for term in BLOCKED_TERMS), re.IGNORECASE)
+
+# Messages that already passed the filter on an earlier turn, keyed by id()
+_cleared_messages: "weakref.WeakValueDictionary[int, ChatMessage]" = weakref.WeakValueDictionary()
+
+
+def _contains_blocked_term(text: str) -> bool:
+    """Return True if text mentions any blocked term (case-insensitive)."""
+    if _BLOCKED_AUTOMATON is not None:
+        # The automaton is case-sensitive; only pay for a folded copy when needed
+        folded = text if text.islower() else text.casefold()
+        return next(_BLOCKED_AUTOMATON.iter(folded), None) is not None
+    return _BLOCKED_RE.search(text) is not None
+
+
+def _blocked_response(text: str) -> ChatResponse:
+    return ChatResponse(messages=[ChatMessage(role=Role.ASSISTANT, text=text)])
+
+
 @chat_middleware
 async def security_filter_middleware(
     context: ChatContext,
     next: Callable[[ChatContext], Awaitable[None]],
 ) -> None:
     """Chat middleware that blocks requests containing sensitive information."""
-    # Block requests with sensitive information
-    blocked_terms = ["password", "secret", "api_key", "token"]
-
     for message in context.messages:
-        if message.text:
-            message_lower = message.text.lower()
-            for term in blocked_terms:
-                if term in message_lower:
-                    # Override the response without calling the LLM
-                    context.result = ChatResponse(
-                        messages=[
-                            ChatMessage(
-                                role=Role.ASSISTANT,
-                                text=(
-                                    "I cannot process requests containing sensitive information. "
-                                    "Please rephrase your question without including passwords, secrets, "
-                                    "or other sensitive data."
-                                ),
-                            )
-                        ]
-                    )
-                    return
+        # History is resent every turn; only check user messages not yet cleared
+        if message.role != Role.USER or _cleared_messages.get(id(message)) is message:
+            continue
+        if message.text and len(message.text) > MAX_MESSAGE_CHARS:
+            # Pasted blobs this large are rejected outright instead of scanned
+            context.result = _blocked_response(
+                f"Your message is too long to process ({len(message.text):,} characters). "
+                f"Please keep requests under {MAX_MESSAGE_CHARS:,} characters."
+            )
+            return
+        if message.text and _contains_blocked_term(message.text):
+            # Override the response without calling the LLM
+            context.result = _blocked_response(
+                "I cannot process requests containing sensitive information. "
+                "Please rephrase your question without including passwords, secrets, "
+                "or other sensitive data."
+            )
+            return
+        _cleared_messages[id(message)] = message
 
     await next(context)
 
 
+_PRODUCTION_RE = re.compile(r"production", re.IGNORECASE)
+
+
+def _targets_production(arguments: object) -> bool:
+    """Return True if the tool's file_path argument points at a production file."""
+    try:
+        file_path = arguments.file_path
+    except AttributeError:
+        return False  # Tool has no file_path argument
+    return bool(file_path) and _PRODUCTION_RE.search(file_path) is not None
+
+
 @function_middleware
 async def production_guard_middleware(
     context: FunctionInvocationContext,
     next: Callable[[FunctionInvocationContext], Awaitable[None]],
 ) -> None:
     """Function middleware that prevents operations on production files."""
-    # Check if file_path parameter contains "production"
-    file_path = getattr(context.arguments, "file_path", None)
-    if file_path and "production" in file_path.lower():
+    if _targets_production(context.arguments):
         context.result = (
             "Blocked! Cannot edit production files directly. "
             "Please use a development or staging environment."
@@ -84,29 +141,21 @@ async def production_guard_middleware(
 def list_files(directory: Annotated[str, "The directory to list files from"]) -> str:
     """List files in a directory."""
     try:
-        result = subprocess.run(
-            f"ls -la {directory}",
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        return result.stdout if result.returncode == 0 else f"Error: {result.stderr}"
-    except subprocess.TimeoutExpired:
-        return "Error: Command timed out"
-    except Exception as e:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        lines = []
+        for entry in entries:
+            st = entry.stat(follow_symlinks=False)
+            mtime = time.strftime("%b %d %H:%M", time.localtime(st.st_mtime))
+            lines.append(f"{stat.filemode(st.st_mode)} {st.st_size:>10} {mtime} {entry.name}")
+        return "\n".join(lines)
+    except (FileNotFoundError, PermissionError, NotADirectoryError) as e:
         return f"Error: {str(e)}"
 
 
-@ai_function
-def check_azure_webapp_status(
-    webapp_name: Annotated[str, "The name of the Azure web app"],
-    resource_group: Annotated[str, "The Azure resource group name"],
-) -> str:
-    """Check Azure web app status using az CLI."""
-    try:
-        # Simulated response since we may not have actual Azure resources
-        return f"""
+# Simulated tool output for demo purposes, built once at import. Only the
+# templates' placeholders are filled in per call.
+_STATUS_TEMPLATE = """
 Simulated Azure Web App Status for {webapp_name}:
 - Resource Group: {resource_group}
 - Status: Running with errors
@@ -121,17 +170,8 @@ Common errors:
 
 Note: This is a simulated response for demo purposes.
 """
-    except Exception as e:
-        return f"Error checking Azure status: {str(e)}"
-
 
-@ai_function
-def read_log_file(
-    log_path: Annotated[str, "Path to the log file to read"]
-) -> str:
-    """Read application log file."""
-    # Simulated log content for demo purposes
-    simulated_logs = """
+SIMULATED_LOGS = """
 [2024-10-09 14:23:15] ERROR - NullPointerException in payment_handler.py:line 47
 [2024-10-09 14:23:15] Traceback:
   File "src/payment_handler.py", line 47, in process_payment
@@ -145,23 +185,9 @@ AttributeError: 'NoneType' object has no attribute 'street'
 [2024-10-09 14:27:18] ERROR - NullPointerException in payment_handler.py:line 47
 """
 
-    try:
-        # In a real scenario, you would actually read the file
-        # with open(log_path, 'r') as f:
-        #     return f.read()
-        return f"Contents of {log_path}:\n{simulated_logs}\n\nNote: This is simulated log content for demo purposes."
-    except Exception as e:
-        return f"Error reading log file: {str(e)}"
-
+_LOG_TEMPLATE = "Contents of {log_path}:\n{logs}\n\nNote: This is simulated log content for demo purposes."
 
-@ai_function
-def scan_codebase(
-    pattern: Annotated[str, "The pattern to search for"],
-    directory: Annotated[str, "The directory to search in"],
-) -> str:
-    """Search for patterns in the codebase using grep."""
-    # Simulated code search results for demo purposes
-    simulated_results = """
+SIMULATED_SCAN_RESULTS = """
 src/payment_handler.py:45:    def process_payment(self, customer):
 src/payment_handler.py:46:        # Process customer payment
 src/payment_handler.py:47:        billing_address = customer.billing_address.street
@@ -173,14 +199,387 @@ checking if billing_address is None first.
 Note: This is simulated search output for demo purposes.
 """
 
+_EDIT_TEMPLATE = """
+Simulated file edit for {file_path}:
+
+OLD:
+{old_content}
+
+NEW:
+{new_content}
+
+File would be updated successfully.
+
+Note: This is a simulated edit for demo purposes. In production, this would
+actually modify the file after receiving approval.
+"""
+
+
+# Status lookups are repeated throughout an investigation, so results are
+# cached per (webapp, resource group) for a short time.
+STATUS_CACHE_TTL = 30.0
+_status_cache: dict[tuple[str, str], tuple[float, str]] = {}
+
+
+def _status_impl(webapp_name: str, resource_group: str) -> str:
+    """Return the web app status, reusing a cached result while it is fresh."""
+    key = (webapp_name, resource_group)
+    now = time.monotonic()
+    cached = _status_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    # Simulated response since we may not have actual Azure resources
+    status = _STATUS_TEMPLATE.format(webapp_name=webapp_name, resource_group=resource_group)
+    _status_cache[key] = (now + STATUS_CACHE_TTL, status)
+    return status
+
+
+@ai_function
+def check_azure_webapp_status(
+    webapp_name: Annotated[str, "The name of the Azure web app"],
+    resource_group: Annotated[str, "The Azure resource group name"],
+) -> str:
+    """Check Azure web app status using az CLI."""
+    try:
+        return _status_impl(webapp_name, resource_group)
+    except Exception as e:
+        return f"Error checking Azure status: {str(e)}"
+
+
+_LOG_TIMESTAMP_RE = re.compile(r"^\[.*?\]\s*")
+
+
+def _dedupe_log_lines(text: str) -> str:
+    """Collapse runs of repeated log lines (ignoring timestamps) into one line.
+
+    Repeated errors are common in the logs this agent reads, and every
+    duplicate line costs prompt tokens without adding information.
+    """
+    lines: list[str] = []
+    prev_key: str | None = None
+    count = 0
+    for line in text.split("\n"):
+        key = _LOG_TIMESTAMP_RE.sub("", line)
+        if key and key == prev_key:
+            count += 1
+            continue
+        if count > 1:
+            lines[-1] += f" (repeated {count}×)"
+        lines.append(line)
+        prev_key, count = key, 1
+    if count > 1:
+        lines[-1] += f" (repeated {count}×)"
+    return "\n".join(lines)
+
+
+# Only the end of a log is read, so multi-GB files cost the same as small ones
+LOG_TAIL_BYTES = 256 * 1024
+_ERROR_LINE_RE = re.compile(rb"ERROR")
+
+
+def _read_log_tail(log_path: str, errors_only: bool) -> str:
+    """Read the last LOG_TAIL_BYTES of a log, starting at a line boundary."""
+    with open(log_path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size > LOG_TAIL_BYTES:
+            # Back up one byte so a tail that starts on a line boundary keeps that line
+            f.seek(size - LOG_TAIL_BYTES - 1)
+            f.readline()  # Drop the partial first line
+        else:
+            f.seek(0)
+        data = f.read()
+
+    if errors_only:
+        data = b"\n".join(line for line in data.splitlines() if _ERROR_LINE_RE.search(line))
+    return data.decode("utf-8", "replace")
+
+
+@functools.lru_cache(maxsize=128)
+def _read_log_impl(log_path: str, mtime_ns: int | None, errors_only: bool = False) -> str:
+    """Read a log file. Keyed on mtime so edits to the file bust the cache."""
+    if mtime_ns is None:
+        # No such file - fall back to simulated content for the demo
+        return _LOG_TEMPLATE.format(log_path=log_path, logs=_dedupe_log_lines(SIMULATED_LOGS))
+
+    logs = _dedupe_log_lines(_read_log_tail(log_path, errors_only))
+    return f"Contents of {log_path} (last {LOG_TAIL_BYTES // 1024} KB):\n{logs}"
+
+
+@ai_function
+def read_log_file(
+    log_path: Annotated[str, "Path to the log file to read"],
+    errors_only: Annotated[bool, "Only return lines containing ERROR"] = False,
+) -> str:
+    """Read the tail of an application log file."""
+    try:
+        st = os.stat(log_path)
+        mtime_ns = st.st_mtime_ns if stat.S_ISREG(st.st_mode) else None
+    except OSError:
+        mtime_ns = None  # Simulated path, nothing on disk to key on
+
+    try:
+        return _read_log_impl(log_path, mtime_ns, errors_only)
+    except Exception as e:
+        return f"Error reading log file: {str(e)}"
+
+
+# Cap on matches returned to the LLM from a codebase scan
+SCAN_MAX_MATCHES = 50
+
+
+async def _ripgrep(pattern: str, directory: str, file_type: str | None = None) -> str | None:
+    """Search with ripgrep, or return None if rg or the directory is unavailable."""
+    rg = shutil.which("rg")
+    if rg is None or not os.path.isdir(directory):
+        return None
+
+    argv = [rg, "--json", "--max-columns=150", "-n"]
+    if file_type:
+        argv += ["--type", file_type]
+    argv += ["-e", pattern, directory]
+    proc = await asyncio.create_subprocess_exec(
+        *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    if proc.returncode not in (0, 1):  # rg exits with 1 when nothing matched
+        return f"Error: {stderr.decode(errors='replace')}"
+
+    matches = []
+    for line in stdout.decode(errors="replace").splitlines():
+        event = json.loads(line)
+        if event["type"] != "match":
+            continue
+        data = event["data"]
+        path = data["path"].get("text", "<binary path>")
+        text = data["lines"].get("text", "").rstrip()
+        matches.append(f"{path}:{data['line_number']}:{text}")
+        if len(matches) >= SCAN_MAX_MATCHES:
+            break
+    return "\n".join(matches) if matches else "No matches found."
+
+
+# Directories ripgrep users almost always ignore, skipped when rg isn't there to apply .gitignore
+_INDEX_SKIP_DIRS = frozenset({"node_modules", "__pycache__"})
+
+
+def _searchable_files(directory: str) -> list[str]:
+    """List the files ripgrep would search, so the index and rg return the same matches."""
+    rg = shutil.which("rg")
+    if rg is not None:
+        # rg --files applies rg's own ignore rules (.gitignore, hidden files)
+        result = subprocess.run([rg, "--files", directory], capture_output=True, text=True, timeout=10)
+        if result.returncode in (0, 1):
+            return result.stdout.splitlines()
+
+    files = []
+    for root, dirs, names in os.walk(directory):
+        # Same defaults as rg: skip hidden entries (including .git) and dependency folders
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d not in _INDEX_SKIP_DIRS]
+        files.extend(os.path.join(root, name) for name in names if not name.startswith("."))
+    return files
+
+
+class _TrigramIndex:
+    """Trigram -> file postings for a directory, used to narrow literal searches.
+
+    A literal pattern can only occur in files that contain every one of its
+    trigrams, so intersecting the posting sets leaves a small candidate list
+    that is then verified line by line. Each search first re-lists the
+    directory and re-reads only files whose mtime or size changed, so edits,
+    new files and deletions are picked up without a full rebuild.
+    """
+
+    MAX_FILE_BYTES = 1024 * 1024
+    # Cap on (trigram, file) pairs held in memory; past it the index is dropped and scans use rg
+    MAX_POSTINGS = 5_000_000
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.complete = True
+        self.postings: dict[bytes, set[str]] = {}
+        self._stamps: dict[str, tuple[int, int]] = {}
+        self._trigrams: dict[str, frozenset[bytes]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Bring the index in line with the files currently on disk."""
+        with self._lock:
+            if not self.complete:
+                return
+            seen = set()
+            for path in _searchable_files(self.directory):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue  # Deleted while listing
+                seen.add(path)
+                stamp = (st.st_mtime_ns, st.st_size)
+                if self._stamps.get(path) == stamp:
+                    continue
+                self._drop(path)
+                self._stamps[path] = stamp
+                if st.st_size <= self.MAX_FILE_BYTES and not self._add(path):
+                    return
+            for path in self._stamps.keys() - seen:
+                self._drop(path)
+                del self._stamps[path]
+
+    def _add(self, path: str) -> bool:
+        """Index one file; returns False if that pushed the index past MAX_POSTINGS."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return True
+        if b"\0" in data:  # Skip binary files, as rg does
+            return True
+        trigrams = frozenset(data[i : i + 3] for i in range(len(data) - 2))
+        self._size += len(trigrams)
+        if self._size > self.MAX_POSTINGS:
+            self.complete = False
+            self.postings.clear()
+            self._stamps.clear()
+            self._trigrams.clear()
+            return False
+        self._trigrams[path] = trigrams
+        for trigram in trigrams:
+            self.postings.setdefault(trigram, set()).add(path)
+        return True
+
+    def _drop(self, path: str) -> None:
+        trigrams = self._trigrams.pop(path, frozenset())
+        self._size -= len(trigrams)
+        for trigram in trigrams:
+            paths = self.postings[trigram]
+            paths.discard(path)
+            if not paths:
+                del self.postings[trigram]
+
+    def search(self, literal: str, limit: int) -> list[str] | None:
+        """Return up to limit matching lines, or None if the index grew too large to keep."""
+        self.refresh()
+        needle = literal.encode()
+        with self._lock:
+            if not self.complete:
+                return None
+            trigrams = sorted(
+                {needle[i : i + 3] for i in range(len(needle) - 2)},
+                key=lambda t: len(self.postings.get(t, ())),
+            )
+            candidates = set(self.postings.get(trigrams[0], ()))
+            for trigram in trigrams[1:]:
+                candidates &= self.postings.get(trigram, set())
+                if not candidates:
+                    break
+
+        matches = []
+        for path in sorted(candidates):
+            try:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    for line_number, line in enumerate(f, start=1):
+                        if literal in line:
+                            matches.append(f"{path}:{line_number}:{line.rstrip()[:150]}")
+                            if len(matches) >= limit:
+                                return matches
+            except OSError:
+                continue  # Deleted since the refresh: a miss, not an error
+        return matches
+
+
+_code_indexes: dict[str, _TrigramIndex] = {}
+_code_index_builds: dict[str, asyncio.Task[None]] = {}
+_code_index_lock = threading.Lock()
+
+
+def rebuild_code_index(directory: str) -> None:
+    """Index a directory from scratch, replacing any existing index for it."""
+    index = _TrigramIndex(directory)
+    with _code_index_lock:
+        _code_indexes[os.path.abspath(directory)] = index
+
+
+async def _indexed_search(pattern: str, directory: str) -> str | None:
+    """Search via the trigram index, or return None if the pattern or index can't be used."""
+    # Only plain literals of 3+ characters can be narrowed down by trigrams
+    if len(pattern) < 3 or re.escape(pattern) != pattern or not os.path.isdir(directory):
+        return None
+
+    key = os.path.abspath(directory)
+    with _code_index_lock:
+        index = _code_indexes.get(key)
+    if index is None:
+        # Build in the background; until it's ready, scans go through ripgrep
+        if key not in _code_index_builds:
+            task = asyncio.create_task(asyncio.to_thread(rebuild_code_index, key))
+            _code_index_builds[key] = task
+            task.add_done_callback(lambda _: _code_index_builds.pop(key, None))
+        return None
+
+    matches = await asyncio.to_thread(index.search, pattern, SCAN_MAX_MATCHES)
+    if matches is None:
+        return None
+    return "\n".join(matches) if matches else "No matches found."
+
+
+@ai_function
+async def scan_codebase(
+    pattern: Annotated[str, "The pattern to search for"],
+    directory: Annotated[str, "The directory to search in"],
+    file_type: Annotated[str | None, "Optional ripgrep file type to restrict the search, e.g. 'py'"] = None,
+) -> str:
+    """Search for patterns in the codebase using ripgrep."""
     try:
-        # In a real scenario, you would run: grep -r pattern directory
-        # result = subprocess.run(...)
-        return f"Searching for '{pattern}' in {directory}:\n{simulated_results}"
+        results = None
+        if not file_type:
+            results = await _indexed_search(pattern, directory)
+        if results is None:
+            results = await _ripgrep(pattern, directory, file_type)
+        if results is None:
+            # No ripgrep or no such directory - fall back to the demo output
+            results = SIMULATED_SCAN_RESULTS
+        return f"Searching for '{pattern}' in {directory}:\n{results}"
+    except asyncio.TimeoutError:
+        return "Error scanning codebase: search timed out"
     except Exception as e:
         return f"Error scanning codebase: {str(e)}"
 
 
+@ai_function
+async def investigate_deployment(
+    webapp_name: Annotated[str, "The name of the Azure web app"],
+    resource_group: Annotated[str, "The Azure resource group name"],
+    log_path: Annotated[str, "Path to the log file to read"],
+    pattern: Annotated[str, "The pattern to search for in the codebase"],
+    directory: Annotated[str, "The directory to search in"],
+) -> str:
+    """Check web app status, read logs, and scan the codebase in one step.
+
+    The three lookups are independent, so they run concurrently and the
+    combined report is returned once the slowest one finishes.
+    """
+    status, logs, scan = await asyncio.gather(
+        asyncio.to_thread(check_azure_webapp_status, webapp_name, resource_group),
+        asyncio.to_thread(read_log_file, log_path),
+        scan_codebase(pattern, directory),
+    )
+    return "\n\n".join(
+        [
+            f"=== Web App Status ===\n{status}",
+            f"=== Application Logs ===\n{logs}",
+            f"=== Codebase Scan ===\n{scan}",
+        ]
+    )
+
+
 # Dangerous operation - requires approval
 @ai_function(approval_mode="always_require")
 def edit_file(
@@ -194,36 +593,33 @@ def edit_file(
     so it requires explicit human approval before execution.
     """
     # Simulated file edit for demo purposes
-    return f"""
-Simulated file edit for {file_path}:
-
-OLD:
-{old_content}
+    return _EDIT_TEMPLATE.format(file_path=file_path, old_content=old_content, new_content=new_content)
 
-NEW:
-{new_content}
 
-File would be updated successfully.
+@functools.lru_cache(maxsize=1)
+def get_chat_client() -> AzureOpenAIChatClient:
+    """Return the shared chat client.
 
-Note: This is a simulated edit for demo purposes. In production, this would
-actually modify the file after receiving approval.
-"""
+    The client owns the HTTP connection pool, so reusing a single instance keeps
+    TLS connections to Azure OpenAI alive across every turn of an investigation.
+    """
+    return AzureOpenAIChatClient(
+        api_key=os.environ.get("AZURE_OPENAI_API_KEY", ""),
+    )
 
 
-# Agent instance following Agent Framework conventions
-agent = ChatAgent(
-    name="DevOpsBot",
-    description="A DevOps troubleshooting agent that diagnoses deployment issues and proposes fixes",
-    instructions="""
+AGENT_INSTRUCTIONS = """
 You are a DevOps troubleshooting assistant. You help engineers diagnose and fix deployment issues.
 
 IMPORTANT: When asked to "check deployment status and address any issues", you should AUTOMATICALLY:
-1. Check the Azure web app status (use check_azure_webapp_status with webapp_name="contoso app" and resource_group="rg-contoso")
-2. If errors are found, read the application logs (use read_log_file with log_path="/var/log/app/error.log")
-3. Analyze the errors to identify patterns
-4. Scan the codebase for the problematic code (use scan_codebase to find the bug)
-5. Identify the root cause and formulate a fix
-6. Propose the fix by calling edit_file with the exact old and new content
+1. Gather the evidence in a single call to investigate_deployment with webapp_name="contoso app",
+   resource_group="rg-contoso", log_path="/var/log/app/error.log", pattern="billing_address" and
+   directory="src". This checks the web app status, reads the logs, and scans the codebase concurrently.
+2. Analyze the errors to identify patterns
+3. Identify the root cause and formulate a fix
+4. Propose the fix by calling edit_file with the exact old and new content
+
+Use check_azure_webapp_status, read_log_file, and scan_codebase individually only for follow-up questions.
 
 When editing files:
 - Always explain WHY the change is needed based on your investigation
@@ -232,19 +628,34 @@ When editing files:
 - Reference the errors you found in the logs
 
 Be thorough, autonomous in your investigation, and always prioritize code safety.
-""",
-    chat_client=AzureOpenAIChatClient(
-        api_key=os.environ.get("AZURE_OPENAI_API_KEY", ""),
-    ),
-    tools=[
-        list_files,
-        check_azure_webapp_status,
-        read_log_file,
-        scan_codebase,
-        edit_file,
-    ],
-    middleware=[security_filter_middleware, production_guard_middleware],
-)
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def get_agent() -> ChatAgent:
+    """Build the agent on first use, so importing this module has no side effects."""
+    return ChatAgent(
+        name="DevOpsBot",
+        description="A DevOps troubleshooting agent that diagnoses deployment issues and proposes fixes",
+        instructions=AGENT_INSTRUCTIONS,
+        chat_client=get_chat_client(),
+        tools=[
+            list_files,
+            check_azure_webapp_status,
+            read_log_file,
+            scan_codebase,
+            investigate_deployment,
+            edit_file,
+        ],
+        middleware=[security_filter_middleware, production_guard_middleware],
+    )
+
+
+def __getattr__(name: str):
+    # Agent instance following Agent Framework conventions, created lazily
+    if name == "agent":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
@@ -267,7 +678,7 @@ def main():
     logger.info("  'Read the application logs'")
 
     # Launch server with the agent
-    serve(entities=[agent], port=8092, auto_open=True)
+    serve(entities=[get_agent()], port=8092, auto_open=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+"""Tests for the DevOps agent's codebase scan."""
+
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("agent_framework")
+
+import agent  # noqa: E402
+
+
+def scan(pattern, directory):
+    return asyncio.run(agent.scan_codebase(pattern, str(directory)))
+
+
+def test_scan_codebase_without_file_type_uses_index(tmp_path):
+    (tmp_path / "models.py").write_text("class Order:\n    billing_address = None\n")
+    (tmp_path / "views.py").write_text("def index():\n    return 'ok'\n")
+    agent.rebuild_code_index(str(tmp_path))
+
+    result = scan("billing_address", tmp_path)
+
+    assert not result.startswith("Error")
+    assert f"{tmp_path / 'models.py'}:2:    billing_address = None" in result
+    assert "views.py" not in result
+
+
+def test_first_scan_builds_index_in_background(tmp_path):
+    (tmp_path / "models.py").write_text("billing_address = None\n")
+    key = os.path.abspath(tmp_path)
+
+    async def first_scan():
+        result = await agent.scan_codebase("billing_address", str(tmp_path))
+        build = agent._code_index_builds.get(key)
+        if build is not None:
+            await build
+        return result
+
+    assert not asyncio.run(first_scan()).startswith("Error")
+    assert key in agent._code_indexes
+
+
+def test_index_follows_file_changes(tmp_path):
+    (tmp_path / "a.py").write_text("billing_address = 1\n")
+    (tmp_path / "b.py").write_text("x = 1\n")
+    agent.rebuild_code_index(str(tmp_path))
+    assert "a.py:1:" in scan("billing_address", tmp_path)
+
+    (tmp_path / "a.py").unlink()
+    (tmp_path / "b.py").write_text("x = 1\nbilling_address = 2\n")
+    (tmp_path / "c.py").write_text("billing_address = 3\n")
+
+    result = scan("billing_address", tmp_path)
+    assert "a.py" not in result
+    assert "b.py:2:" in result
+    assert "c.py:1:" in result
+
+
+def test_index_skips_what_ripgrep_skips(tmp_path):
+    (tmp_path / "app.py").write_text("billing_address = 1\n")
+    for ignored in (".git", "node_modules"):
+        (tmp_path / ignored).mkdir()
+        (tmp_path / ignored / "copy.py").write_text("billing_address = 1\n")
+    (tmp_path / "blob.bin").write_bytes(b"billing_address\0")
+    agent.rebuild_code_index(str(tmp_path))
+
+    result = scan("billing_address", tmp_path)
+
+    assert "app.py:1:" in result
+    assert ".git" not in result
+    assert "blob.bin" not in result
+    if agent.shutil.which("rg") is None:
+        assert "node_modules" not in result
+
+
+def test_oversized_index_falls_back_to_ripgrep(tmp_path, monkeypatch):
+    (tmp_path / "big.py").write_text("billing_address = 'abcdefghijklmnopqrstuvwxyz'\n")
+    monkeypatch.setattr(agent._TrigramIndex, "MAX_POSTINGS", 10)
+    agent.rebuild_code_index(str(tmp_path))
+
+    assert not agent._code_indexes[os.path.abspath(tmp_path)].complete
+    assert asyncio.run(agent._indexed_search("billing_address", str(tmp_path))) is None
+    assert not scan("billing_address", tmp_path).startswith("Error")
@@ -14,16 +14,42 @@ children's book with age-appropriate content, parent discussion guides, and imag
 """
 
 import asyncio
+import base64
+import contextlib
+import functools
+import hashlib
+import json
+import mimetypes
 import os
 import random
+import re
+import sqlite3
+import threading
+import time
+import webbrowser
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from typing import Any
-
-from agent_framework import WorkflowBuilder, WorkflowContext, executor
+from typing import Any, Literal, NamedTuple
+
+from agent_framework import (
+    AgentExecutorRequest,
+    AgentExecutorResponse,
+    ChatMessage,
+    Role,
+    WorkflowBuilder,
+    WorkflowContext,
+    executor,
+)
 from agent_framework.azure import AzureOpenAIChatClient
 from pydantic import BaseModel, Field
 from typing_extensions import Never
 
+try:
+    from google import genai
+    from google.genai import types as genai_types
+except ImportError:  # optional: AI images (pip install google-genai); Unsplash is the fallback
+    genai = None
+
 
 # ============================================================================
 # Pydantic Models for Structured Outputs
@@ -74,6 +100,12 @@ class QAResult(BaseModel):
     issues: list[str] = Field(default_factory=list, description="Issues found")
     strengths: list[str] = Field(default_factory=list, description="What works well")
     recommendations: list[str] = Field(default_factory=list, description="Improvement suggestions")
+    failing_page_numbers: list[int] = Field(
+        default_factory=list, description="Pages that need to be regenerated (empty = whole book)"
+    )
+    retry_reason: Literal["text_only", "images", "both"] = Field(
+        default="both", description="What the rework is for: the text, the images, or both"
+    )
 
 
 class CompletePage(BaseModel):
@@ -99,40 +131,46 @@ class FinalBook(BaseModel):
     qa_score: int
 
 
+# Generate each structured-output schema once at import, so a broken model fails at startup
+# and any deferred schema building happens here rather than on the first agent call.
+for _model in (PageContent, QAResult, BookStructure, FinalBook):
+    _model.model_json_schema()
+
+
 # ============================================================================
 # Message Types for Workflow Communication
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContentGeneratorInput:
     """Input message for content generator."""
 
     structure: BookStructure
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageGeneratorInput:
     """Input message for image generator."""
 
     structure: BookStructure
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AllPagesContentResult:
     """Result from content generator with all page content."""
 
     pages_content: dict[int, PageContent]  # page_number -> PageContent
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AllImagesResult:
     """Result from image generator with all images."""
 
     page_images: dict[int, str]  # page_number -> image_url
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BookQAInput:
     """Input for book QA - aggregated from fan-in."""
 
@@ -141,6 +179,12 @@ class BookQAInput:
     page_images: dict[int, str]
 
 
+# Caps on concurrent per-page model calls, shared by every workflow run in this process.
+# Keeps fan-out under API rate limits and Gemini calls from filling the default thread pool.
+_AZURE_SEM = asyncio.Semaphore(int(os.environ.get("AZURE_MAX_CONCURRENCY", "8")))
+_GEMINI_SEM = asyncio.Semaphore(int(os.environ.get("GEMINI_MAX_CONCURRENCY", "4")))
+
+
 # ============================================================================
 # Executor: Extract BookStructure from Agent Response
 # ============================================================================
@@ -149,8 +193,6 @@ class BookQAInput:
 @executor(id="extract_structure")
 async def extract_structure(response: Any, ctx: WorkflowContext[BookStructure]) -> None:
     """Extract BookStructure from agent response and store in shared state."""
-    from agent_framework import AgentExecutorResponse
-
     # Extract text from AgentExecutorResponse
     if isinstance(response, AgentExecutorResponse):
         text = response.agent_run_response.text
@@ -167,6 +209,138 @@ async def extract_structure(response: Any, ctx: WorkflowContext[BookStructure])
     await ctx.send_message(structure)
 
 
+# ============================================================================
+# LLM Response Cache
+# ============================================================================
+
+
+class LLMCache:
+    """Exact-match cache of agent responses, persisted in SQLite.
+
+    Lookups run in a worker thread so the event loop never waits on disk.
+    """
+
+    def __init__(self, path: str, ttl: int = 86400):
+        self.path = path
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0}
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened on first use so importing the workflow doesn't create the file
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+            conn.commit()
+
+    async def get(self, key: str) -> str | None:
+        value = await asyncio.to_thread(self._get, key)
+        self.stats["hits" if value is not None else "misses"] += 1
+        return value
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        await asyncio.to_thread(self._set, key, value, self.ttl if ttl is None else ttl)
+
+
+# Page content responses, keyed by the page plan and any QA feedback in the prompt
+content_cache = LLMCache(os.path.join(os.path.dirname(__file__), ".llm_cache.sqlite"))
+
+# Agent calls currently running, by cache key, so identical requests share one call
+_inflight: dict[str, asyncio.Future[str]] = {}
+
+
+async def single_flight(key: str, produce: Callable[[], Awaitable[str]]) -> str:
+    """Run produce() once per key at a time; concurrent callers with the same key await its result."""
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        return await asyncio.shield(inflight)
+
+    future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await produce()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved so an unawaited failure isn't logged twice
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight[key]
+
+
+async def gather_or_cancel(aws: list[Awaitable[Any]]) -> list[Any]:
+    """Run awaitables concurrently; if one fails, cancel the rest and re-raise its error.
+
+    Same behaviour as asyncio.TaskGroup, which needs Python 3.11+.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+# ============================================================================
+# Retry Helper: keep pages QA did not flag
+# ============================================================================
+
+
+# The QA retry_reason that leaves each kind of output untouched
+_UNAFFECTED_BY = {"text": "images", "images": "text_only"}
+
+
+async def get_pages_to_keep(
+    ctx: WorkflowContext[Any], state_key: str, aspect: Literal["text", "images"]
+) -> tuple[dict, set[int]]:
+    """On a QA retry that names failing pages, return (previous per-page results, failing pages).
+
+    When QA only faulted the other aspect (e.g. text-only issues for the images), every
+    previous result is kept and the failing set is empty. Returns ({}, set()) on the first
+    run or when QA asked for the whole book to be redone.
+    """
+    try:
+        qa_feedback: QAResult = await ctx.get_shared_state("book:qa_feedback")
+        previous: dict = await ctx.get_shared_state(state_key)
+    except KeyError:
+        return {}, set()
+
+    if qa_feedback.approved:
+        return {}, set()
+    if qa_feedback.retry_reason == _UNAFFECTED_BY[aspect]:
+        return previous, set()
+    if not qa_feedback.failing_page_numbers:
+        return {}, set()
+    return previous, set(qa_feedback.failing_page_numbers)
+
+
 # ============================================================================
 # Executor: Content Generator (processes all pages internally)
 # ============================================================================
@@ -178,7 +352,7 @@ async def content_generator(
 ) -> None:
     """Generate educational content for all pages in parallel.
 
-    Internally uses asyncio.gather to process all pages simultaneously.
+    Internally processes all pages concurrently; if one page fails, the rest are cancelled.
     On retry (if QA feedback exists), incorporates QA recommendations.
     """
     # Check if this is a retry (QA feedback exists)
@@ -194,34 +368,17 @@ async def content_generator(
         print(f"\n🔄 Retry attempt {iterations - 1}: Incorporating QA feedback...")
         print(f"   Issues: {', '.join(qa_feedback.issues[:2])}")  # Show first 2 issues
 
-    # Create content generator agent with structured output
-    chat_client = AzureOpenAIChatClient(api_key=os.environ.get("AZURE_OPENAI_API_KEY", ""))
-
-    content_gen_agent = chat_client.create_agent(
-        name="ContentGenerator",
-        instructions="""You are a children's book writer specializing in educational content for 6-year-olds.
-
-Kid Text (2-3 simple sentences):
-- Maximum 10 words per sentence
-- Use story/narrative format with engaging characters
-- Avoid complex words (or explain them simply inline)
-- Make it fun and memorable!
-
-Parent Guide:
-- Provide 3-5 detailed discussion points
-- Suggest open-ended questions to ask the child
-- Give deeper explanations of the concept with examples
-- Include real-world connections and activities to try together
-- Reference additional learning resources (books, videos, experiments)
-
-Key Vocabulary:
-- List 2-4 important words from this page
-- These will be highlighted for parents to explain""",
-        response_format=PageContent,
-    )
+    # Pages QA didn't flag keep their previous content
+    previous_content, failing_pages = await get_pages_to_keep(ctx, "book:pages_content", "text")
+    if failing_pages:
+        print(f"   Regenerating pages: {', '.join(map(str, sorted(failing_pages)))}")
 
     async def generate_page_content(page_plan: PagePlan) -> PageContent:
         """Generate content for a single page."""
+        previous = previous_content.get(page_plan.page_number)
+        if previous is not None and page_plan.page_number not in failing_pages:
+            return previous
+
         prompt = f"""Create content for page {page_plan.page_number}:
 
 Title: {page_plan.title}
@@ -231,7 +388,9 @@ Story Element: {page_plan.story_element}
 Generate engaging kid-friendly text and a helpful parent guide."""
 
         # Add QA feedback if this is a retry
+        feedback = None
         if qa_feedback and not qa_feedback.approved:
+            feedback = {"issues": qa_feedback.issues, "recommendations": qa_feedback.recommendations}
             prompt += f"""
 
 IMPORTANT - Previous version had issues. Please address this feedback:
@@ -239,14 +398,45 @@ Issues: {'; '.join(qa_feedback.issues)}
 Recommendations: {'; '.join(qa_feedback.recommendations)}
 """
 
-        result = await content_gen_agent.run(prompt)
-        content = PageContent.model_validate_json(result.text)
+        # Same agent + same page plan + same feedback -> reuse the earlier response
+        cache_key = hashlib.sha256(
+            json.dumps(
+                {
+                    **CONTENT_GEN_FINGERPRINT,
+                    "title": page_plan.title,
+                    "concept": page_plan.concept,
+                    "story_element": page_plan.story_element,
+                    "feedback": feedback,
+                },
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+
+        async def run_agent() -> str:
+            async with _AZURE_SEM:
+                result = await content_gen_agent.run(prompt)
+            return result.text
+
+        # Cache first; otherwise one agent call per distinct key, shared by duplicate pages
+        cached = await content_cache.get(cache_key)
+        text = cached if cached is not None else await single_flight(cache_key, run_agent)
+        content = PageContent.model_validate_json(text)
+        if cached is None:
+            await content_cache.set(cache_key, text)
         # Ensure page number matches
         content.page_number = page_plan.page_number
         return content
 
-    # Process all pages in parallel using asyncio.gather
-    page_contents = await asyncio.gather(*[generate_page_content(page) for page in structure.pages])
+    # Process all pages in parallel; if one page fails the rest are cancelled
+    try:
+        page_contents = await gather_or_cancel(
+            [generate_page_content(page) for page in structure.pages]
+        )
+    except Exception:
+        print("❌ Content generation failed; cancelled the remaining pages")
+        raise
+
+    print(f"💾 Content cache: {content_cache.stats['hits']} hits, {content_cache.stats['misses']} misses")
 
     # Create dictionary of page_number -> PageContent
     pages_content_dict = {content.page_number: content for content in page_contents}
@@ -263,6 +453,12 @@ Recommendations: {'; '.join(qa_feedback.recommendations)}
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=1)
+def get_gemini_client(api_key: str) -> "genai.Client":
+    """Create the Gemini client once and reuse its connections for every page."""
+    return genai.Client(api_key=api_key)
+
+
 async def generate_ai_image(prompt: str, page_number: int) -> str | None:
     """Generate an image using Gemini AI (async).
 
@@ -273,10 +469,11 @@ async def generate_ai_image(prompt: str, page_number: int) -> str | None:
     Returns:
         File path to generated image, or None if generation failed
     """
-    try:
-        from google import genai
-        from google.genai import types
+    if genai is None:
+        print("⚠️  google-genai package not installed. Install with: pip install google-genai")
+        return None
 
+    try:
         api_key = os.environ.get("GEMINI_API_KEY")
         if not api_key:
             print("⚠️  GEMINI_API_KEY not set, skipping AI image generation")
@@ -284,20 +481,20 @@ async def generate_ai_image(prompt: str, page_number: int) -> str | None:
 
         # Run the blocking Gemini API call in a thread pool
         def _sync_generate() -> str | None:
-            client = genai.Client(api_key=api_key)
+            client = get_gemini_client(api_key)
 
             model = "gemini-2.5-flash-image-preview"
             contents = [
-                types.Content(
+                genai_types.Content(
                     role="user",
                     parts=[
-                        types.Part.from_text(
+                        genai_types.Part.from_text(
                             text=f"Create a colorful, kid-friendly illustration for a children's book: {prompt}"
                         ),
                     ],
                 ),
             ]
-            generate_content_config = types.GenerateContentConfig(
+            generate_content_config = genai_types.GenerateContentConfig(
                 response_modalities=[
                     "IMAGE",
                 ],
@@ -314,22 +511,15 @@ async def generate_ai_image(prompt: str, page_number: int) -> str | None:
                 ):
                     continue
 
-                if (
-                    chunk.candidates[0].content.parts[0].inline_data
-                    and chunk.candidates[0].content.parts[0].inline_data.data
-                ):
-                    inline_data = chunk.candidates[0].content.parts[0].inline_data
-                    data_buffer = inline_data.data
-
-                    # Save image file
-                    import mimetypes
-
+                inline_data = chunk.candidates[0].content.parts[0].inline_data
+                if inline_data and inline_data.data:
+                    # Each inline part carries a whole image; write it straight from the response
                     file_extension = mimetypes.guess_extension(inline_data.mime_type) or ".png"
                     file_name = f"generated_page_{page_number}{file_extension}"
                     file_path = os.path.join(os.path.dirname(__file__), file_name)
 
                     with open(file_path, "wb") as f:
-                        f.write(data_buffer)
+                        f.write(inline_data.data)
 
                     print(f"✅ AI image generated: {file_name}")
                     return file_path
@@ -338,22 +528,22 @@ async def generate_ai_image(prompt: str, page_number: int) -> str | None:
             return None
 
         # Run in thread pool to avoid blocking the event loop
-        return await asyncio.to_thread(_sync_generate)
+        async with _GEMINI_SEM:
+            return await asyncio.to_thread(_sync_generate)
 
-    except ImportError:
-        print("⚠️  google-genai package not installed. Install with: pip install google-genai")
-        return None
     except Exception as e:
         print(f"❌ Error generating AI image for page {page_number}: {type(e).__name__}: {e}")
         return None
 
 
+_STOP = frozenset({"a", "an", "the", "is", "are", "in", "on", "at", "for", "with", "of"})
+# Runs of 3+ letters, so punctuation never ends up glued to a keyword
+_WORD_RE = re.compile(r"[a-z]{3,}")
+
+
 def extract_keywords(image_prompt: str) -> list[str]:
     """Extract meaningful keywords from image prompt."""
-    stop_words = {"a", "an", "the", "is", "are", "in", "on", "at", "for", "with", "of"}
-    words = image_prompt.lower().replace(",", " ").split()
-    keywords = [w for w in words if w not in stop_words and len(w) > 2]
-    return keywords[:3]  # Limit to 3 keywords
+    return [w for w in _WORD_RE.findall(image_prompt.lower()) if w not in _STOP][:3]  # Limit to 3 keywords
 
 
 def generate_unsplash_image(image_prompt: str) -> str:
@@ -375,8 +565,16 @@ async def image_generator(structure: BookStructure, ctx: WorkflowContext[AllImag
     Tries Gemini AI first, falls back to Unsplash if unavailable.
     """
 
+    # Pages QA didn't flag keep their previous image; a text-only retry keeps them all
+    previous_images, failing_pages = await get_pages_to_keep(ctx, "book:page_images", "images")
+    if previous_images and not failing_pages:
+        print("🎨 QA only flagged the text, reusing all previous images")
+
     async def generate_page_image(page_plan: PagePlan) -> tuple[int, str]:
         """Generate image for a single page with AI or fallback."""
+        previous = previous_images.get(page_plan.page_number)
+        if previous is not None and page_plan.page_number not in failing_pages:
+            return page_plan.page_number, previous
 
         # Try AI image generation first (now async)
         print(f"🎨 Generating image for page {page_plan.page_number}...")
@@ -390,14 +588,16 @@ async def image_generator(structure: BookStructure, ctx: WorkflowContext[AllImag
             print(f"📸 Using Unsplash fallback for page {page_plan.page_number}")
             image_url = generate_unsplash_image(page_plan.image_prompt)
 
-        # Simulate API delay for Unsplash
-        if not ai_image_path:
-            await asyncio.sleep(0.5)
-
         return page_plan.page_number, image_url
 
-    # Process all pages in parallel using asyncio.gather
-    image_results = await asyncio.gather(*[generate_page_image(page) for page in structure.pages])
+    # Process all pages in parallel; if one page fails the rest are cancelled
+    try:
+        image_results = await gather_or_cancel(
+            [generate_page_image(page) for page in structure.pages]
+        )
+    except Exception:
+        print("❌ Image generation failed; cancelled the remaining pages")
+        raise
 
     # Create dictionary of page_number -> image_url
     page_images_dict = {page_num: url for page_num, url in image_results}
@@ -414,22 +614,11 @@ async def image_generator(structure: BookStructure, ctx: WorkflowContext[AllImag
 # ============================================================================
 
 
-@executor(id="qa_aggregator")
-async def qa_aggregator(
-    messages: list[AllPagesContentResult | AllImagesResult], ctx: WorkflowContext[Any]
-) -> None:
-    """Aggregate content and images from fan-in for QA review."""
-    from agent_framework import AgentExecutorRequest, ChatMessage, Role
-
-    # Extract from aggregated messages
-    content_result = next(m for m in messages if isinstance(m, AllPagesContentResult))
-    images_result = next(m for m in messages if isinstance(m, AllImagesResult))
-
-    # Get structure from shared state
-    structure: BookStructure = await ctx.get_shared_state("book:structure")
-
-    # Build a comprehensive prompt for the QA agent
-    qa_prompt = f"""Review this complete children's educational book:
+def _build_qa_prompt(
+    structure: BookStructure, content_result: AllPagesContentResult, images_result: AllImagesResult
+) -> str:
+    """Build the full-book prompt for the QA agent (pure CPU; run via asyncio.to_thread)."""
+    prompt_parts = [f"""Review this complete children's educational book:
 
 **Book Title:** {structure.book_title}
 **Target Age:** {structure.target_age}
@@ -437,14 +626,14 @@ async def qa_aggregator(
 {chr(10).join(f"- {obj}" for obj in structure.learning_objectives)}
 
 **Pages:**
-"""
+"""]
 
     for page_plan in structure.pages:
         page_num = page_plan.page_number
         content = content_result.pages_content[page_num]
         image_url = images_result.page_images[page_num]
 
-        qa_prompt += f"""
+        prompt_parts.append(f"""
 
 --- Page {page_num}: {page_plan.title} ---
 Concept: {page_plan.concept}
@@ -458,7 +647,24 @@ Parent Guide:
 
 Key Vocabulary: {', '.join(content.key_vocabulary)}
 Image: {image_url}
-"""
+""")
+    return "".join(prompt_parts)
+
+
+@executor(id="qa_aggregator")
+async def qa_aggregator(
+    messages: list[AllPagesContentResult | AllImagesResult], ctx: WorkflowContext[Any]
+) -> None:
+    """Aggregate content and images from fan-in for QA review."""
+    # Extract from aggregated messages
+    content_result = next(m for m in messages if isinstance(m, AllPagesContentResult))
+    images_result = next(m for m in messages if isinstance(m, AllImagesResult))
+
+    # Get structure from shared state
+    structure: BookStructure = await ctx.get_shared_state("book:structure")
+
+    # Assembling the prompt is pure string work that grows with page count, so keep it off the loop
+    qa_prompt = await asyncio.to_thread(_build_qa_prompt, structure, content_result, images_result)
 
     # Send as AgentExecutorRequest for the QA agent
     await ctx.send_message(
@@ -467,24 +673,58 @@ Image: {image_url}
 
 
 # ============================================================================
-# Executor: Extract QA Result from Agent Response
+# Executor: Book QA Review (streamed, stops early on approval)
 # ============================================================================
 
+# The structured verdict streams in schema order, so "approved" and "overall_score" come first.
+# The score only counts once a delimiter follows it, so a partial number is never read.
+_QA_APPROVED_RE = re.compile(r'"approved"\s*:\s*true')
+_QA_SCORE_RE = re.compile(r'"overall_score"\s*:\s*(\d+)\s*[,}]')
+# Characters kept from earlier updates so a field split across two updates still matches
+_QA_SCAN_OVERLAP = 64
 
-@executor(id="extract_qa_result")
-async def extract_qa_result(response: Any, ctx: WorkflowContext[QAResult | BookStructure]) -> None:
-    """Extract QAResult from book QA agent response and handle retry logic."""
-    from agent_framework import AgentExecutorResponse
 
-    # Extract text from AgentExecutorResponse
-    if isinstance(response, AgentExecutorResponse):
-        text = response.agent_run_response.text
-    else:
-        raise TypeError(f"Expected AgentExecutorResponse, got {type(response)}")
+@executor(id="book_qa_review")
+async def book_qa_review(request: AgentExecutorRequest, ctx: WorkflowContext[QAResult]) -> None:
+    """Run the BookQA agent with streaming and hand its verdict to extract_qa_result.
 
-    # Parse the structured output
-    qa_result = QAResult.model_validate_json(text)
+    An approved book only needs the verdict and score, so the stream is closed as soon
+    as both have arrived. A rejected book is parsed in full for its issues and
+    recommendations. One thread is kept per workflow run, so each retry's review sees
+    the earlier ones, as it did under AgentExecutor.
+    """
+    try:
+        thread = await ctx.get_shared_state("book:qa_thread")
+    except KeyError:
+        thread = book_qa.get_new_thread()
+        await ctx.set_shared_state("book:qa_thread", thread)
+
+    parts: list[str] = []
+    window = ""  # Recent text only, so each update is scanned once rather than the whole buffer
+    approved = False
+    score: int | None = None
+    async with contextlib.aclosing(book_qa.run_stream(request.messages, thread=thread)) as stream:
+        async for update in stream:
+            parts.append(update.text)
+            window = window[-_QA_SCAN_OVERLAP:] + update.text
+            approved = approved or _QA_APPROVED_RE.search(window) is not None
+            if score is None and (match := _QA_SCORE_RE.search(window)):
+                score = min(int(match.group(1)), 100)
+            if approved and score is not None:
+                await ctx.send_message(QAResult(approved=True, overall_score=score))
+                return
+
+    await ctx.send_message(QAResult.model_validate_json("".join(parts)))
+
+
+# ============================================================================
+# Executor: QA Decision (compile or retry)
+# ============================================================================
 
+
+@executor(id="extract_qa_result")
+async def extract_qa_result(qa_result: QAResult, ctx: WorkflowContext[QAResult | BookStructure]) -> None:
+    """Record the QA verdict and either send the book to the compiler or retry generation."""
     # Store QA feedback in shared state for potential retry
     await ctx.set_shared_state("book:qa_feedback", qa_result)
 
@@ -514,146 +754,113 @@ async def extract_qa_result(response: Any, ctx: WorkflowContext[QAResult | BookS
 # ============================================================================
 
 
-def generate_html_book(book: FinalBook) -> str:
-    """Generate a beautiful, interactive HTML book."""
+# Embed images as base64 data URLs so the HTML works on its own (larger file, slower to build).
+# By default the HTML links the generated images, which are saved in the same directory.
+SELF_CONTAINED_HTML = os.environ.get("BOOK_SELF_CONTAINED_HTML") == "1"
 
-    def image_to_data_url(image_path: str) -> str:
-        """Convert local image file to data URL for embedding in HTML."""
-        if not image_path.startswith("file://"):
-            return image_path  # Already a URL (e.g., Unsplash)
 
-        # Remove file:// prefix
-        local_path = image_path.replace("file://", "")
+def image_src_for_html(image_path: str) -> str:
+    """Return the <img> src for a page image: its file name for local images, else the URL."""
+    if not image_path.startswith("file://"):
+        return image_path  # Already a URL (e.g., Unsplash)
+    return os.path.basename(image_path.replace("file://", ""))
 
-        try:
-            import base64
-            import mimetypes
 
-            with open(local_path, "rb") as f:
-                image_data = f.read()
+@functools.lru_cache(maxsize=128)
+def _encode_image(local_path: str, mtime_ns: int, size: int) -> str:
+    """Read and base64-encode an image; mtime/size in the key invalidate changed files."""
+    with open(local_path, "rb") as f:
+        image_data = f.read()
 
-            mime_type = mimetypes.guess_type(local_path)[0] or "image/png"
-            encoded = base64.b64encode(image_data).decode("utf-8")
-            return f"data:{mime_type};base64,{encoded}"
-        except Exception as e:
-            print(f"⚠️  Failed to embed image {local_path}: {e}")
-            return image_path  # Return original path as fallback
+    mime_type = mimetypes.guess_type(local_path)[0] or "image/png"
+    encoded = base64.b64encode(image_data).decode("utf-8")
+    return f"data:{mime_type};base64,{encoded}"
 
-    # Build vocabulary tooltips
-    vocab_highlights = ""
-    all_vocab = set()
-    for page in book.pages:
-        all_vocab.update(page.key_vocabulary)
 
-    # Build pages HTML
-    pages_html = ""
-    for i, page in enumerate(book.pages):
-        # Highlight vocabulary in kid text
-        kid_text_highlighted = page.kid_text
-        for vocab in page.key_vocabulary:
-            kid_text_highlighted = kid_text_highlighted.replace(
-                vocab,
-                f'<span class="vocab" title="Key word!">{vocab}</span>'
-            )
+def image_to_data_url(image_path: str) -> str:
+    """Convert local image file to data URL for embedding in HTML."""
+    if not image_path.startswith("file://"):
+        return image_path  # Already a URL (e.g., Unsplash)
 
-        # Convert image to data URL if it's a local file
-        image_src = image_to_data_url(page.image_url)
+    # Remove file:// prefix
+    local_path = image_path.replace("file://", "")
 
-        pages_html += f"""
-        <section class="page" id="page-{page.page_number}">
-            <div class="page-content">
-                <div class="page-number">Page {page.page_number} of {len(book.pages)}</div>
-                <h2 class="page-title">{page.title}</h2>
-                <div class="concept-badge">💡 {page.concept}</div>
+    try:
+        # Images that didn't change since the last compile (e.g. across QA retries) are reused
+        st = os.stat(local_path)
+        return _encode_image(local_path, st.st_mtime_ns, st.st_size)
+    except Exception as e:
+        print(f"⚠️  Failed to embed image {local_path}: {e}")
+        return image_path  # Return original path as fallback
 
-                <div class="image-container">
-                    <img src="{image_src}" alt="{page.title}" class="page-image" loading="lazy">
-                </div>
 
-                <div class="kid-text">
-                    <p>{kid_text_highlighted}</p>
-                </div>
+def write_text_file(path: str, content: str) -> None:
+    """Write a UTF-8 text file (run via asyncio.to_thread from executors)."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
 
-                <details class="parent-guide">
-                    <summary>📖 Parent Discussion Guide</summary>
-                    <div class="guide-content">
-                        <p>{page.parent_guide}</p>
-                        <div class="vocabulary">
-                            <strong>Key Vocabulary:</strong> {', '.join(page.key_vocabulary)}
-                        </div>
-                    </div>
-                </details>
-            </div>
-        </section>
-        """
 
-    # Build learning objectives list
-    objectives_html = "\n".join([f"<li>{obj}</li>" for obj in book.learning_objectives])
+# ============================================================================
+# HTML Book Template (built once at import; filled in by generate_html_book)
+# ============================================================================
 
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{book.title}</title>
-    <style>
-        * {{
+BOOK_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Comic Sans MS', 'Chalkboard SE', 'Arial Rounded MT Bold', sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: #333;
             line-height: 1.6;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 900px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
 
-        .cover {{
+        .cover {
             background: white;
             border-radius: 20px;
             padding: 60px 40px;
             text-align: center;
             margin-bottom: 30px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-        }}
+        }
 
-        .cover h1 {{
+        .cover h1 {
             color: #667eea;
             font-size: 3em;
             margin-bottom: 20px;
             text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        }}
+        }
 
-        .cover .subtitle {{
+        .cover .subtitle {
             font-size: 1.3em;
             color: #666;
             margin-bottom: 30px;
-        }}
+        }
 
-        .cover .metadata {{
+        .cover .metadata {
             display: flex;
             justify-content: center;
             gap: 30px;
             font-size: 1.1em;
             color: #888;
             margin-bottom: 30px;
-        }}
+        }
 
-        .cover .metadata span {{
+        .cover .metadata span {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .qa-score {{
+        .qa-score {
             display: inline-block;
             background: #4CAF50;
             color: white;
@@ -661,68 +868,68 @@ def generate_html_book(book: FinalBook) -> str:
             border-radius: 30px;
             font-size: 1.2em;
             font-weight: bold;
-        }}
+        }
 
-        .objectives {{
+        .objectives {
             background: #f8f9fa;
             padding: 20px;
             border-radius: 10px;
             margin-top: 20px;
-        }}
+        }
 
-        .objectives h3 {{
+        .objectives h3 {
             color: #667eea;
             margin-bottom: 15px;
-        }}
+        }
 
-        .objectives ul {{
+        .objectives ul {
             list-style: none;
             padding-left: 0;
-        }}
+        }
 
-        .objectives li {{
+        .objectives li {
             padding: 8px 0;
             padding-left: 25px;
             position: relative;
-        }}
+        }
 
-        .objectives li:before {{
+        .objectives li:before {
             content: "✓";
             color: #4CAF50;
             font-weight: bold;
             position: absolute;
             left: 0;
-        }}
+        }
 
-        .page {{
+        .page {
             background: white;
             border-radius: 20px;
             padding: 40px;
             margin-bottom: 30px;
             box-shadow: 0 10px 40px rgba(0,0,0,0.2);
             animation: fadeIn 0.5s ease-in;
-        }}
+        }
 
-        @keyframes fadeIn {{
-            from {{ opacity: 0; transform: translateY(20px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
+        @keyframes fadeIn {
+            from { opacity: 0; transform: translateY(20px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
 
-        .page-number {{
+        .page-number {
             text-align: right;
             color: #999;
             font-size: 0.9em;
             margin-bottom: 10px;
-        }}
+        }
 
-        .page-title {{
+        .page-title {
             color: #667eea;
             font-size: 2.2em;
             margin-bottom: 15px;
             text-align: center;
-        }}
+        }
 
-        .concept-badge {{
+        .concept-badge {
             background: #e3f2fd;
             color: #1976d2;
             padding: 8px 16px;
@@ -730,22 +937,22 @@ def generate_html_book(book: FinalBook) -> str:
             display: inline-block;
             margin-bottom: 25px;
             font-size: 0.95em;
-        }}
+        }
 
-        .image-container {{
+        .image-container {
             text-align: center;
             margin: 30px 0;
-        }}
+        }
 
-        .page-image {{
+        .page-image {
             max-width: 100%;
             border-radius: 15px;
             box-shadow: 0 5px 20px rgba(0,0,0,0.2);
             max-height: 400px;
             object-fit: cover;
-        }}
+        }
 
-        .kid-text {{
+        .kid-text {
             font-size: 1.8em;
             line-height: 1.8;
             color: #2c3e50;
@@ -755,23 +962,23 @@ def generate_html_book(book: FinalBook) -> str:
             background: #fff9c4;
             border-radius: 15px;
             border-left: 5px solid #ffd54f;
-        }}
+        }
 
-        .vocab {{
+        .vocab {
             color: #d32f2f;
             font-weight: bold;
             cursor: help;
             border-bottom: 2px dotted #d32f2f;
-        }}
+        }
 
-        .parent-guide {{
+        .parent-guide {
             margin-top: 30px;
             border: 2px solid #e0e0e0;
             border-radius: 10px;
             overflow: hidden;
-        }}
+        }
 
-        .parent-guide summary {{
+        .parent-guide summary {
             background: #f5f5f5;
             padding: 15px 20px;
             cursor: pointer;
@@ -779,40 +986,40 @@ def generate_html_book(book: FinalBook) -> str:
             color: #555;
             user-select: none;
             transition: background 0.3s;
-        }}
+        }
 
-        .parent-guide summary:hover {{
+        .parent-guide summary:hover {
             background: #e0e0e0;
-        }}
+        }
 
-        .parent-guide[open] summary {{
+        .parent-guide[open] summary {
             background: #667eea;
             color: white;
-        }}
+        }
 
-        .guide-content {{
+        .guide-content {
             padding: 20px;
             background: #fafafa;
             line-height: 1.8;
-        }}
+        }
 
-        .vocabulary {{
+        .vocabulary {
             margin-top: 15px;
             padding: 15px;
             background: white;
             border-radius: 8px;
             border-left: 4px solid #4CAF50;
-        }}
+        }
 
-        .navigation {{
+        .navigation {
             position: fixed;
             bottom: 30px;
             right: 30px;
             display: flex;
             gap: 10px;
-        }}
+        }
 
-        .nav-btn {{
+        .nav-btn {
             background: white;
             border: none;
             padding: 15px 25px;
@@ -821,61 +1028,71 @@ def generate_html_book(book: FinalBook) -> str:
             font-size: 1.1em;
             box-shadow: 0 5px 20px rgba(0,0,0,0.2);
             transition: all 0.3s;
-        }}
+        }
 
-        .nav-btn:hover {{
+        .nav-btn:hover {
             transform: translateY(-3px);
             box-shadow: 0 8px 25px rgba(0,0,0,0.3);
-        }}
+        }
 
-        .footer {{
+        .footer {
             text-align: center;
             padding: 40px;
             color: white;
             font-size: 0.9em;
-        }}
+        }
 
-        @media print {{
-            body {{
+        @media print {
+            body {
                 background: white;
-            }}
-            .navigation {{
+            }
+            .navigation {
                 display: none;
-            }}
-            .page {{
+            }
+            .page {
                 page-break-after: always;
                 box-shadow: none;
-            }}
-        }}
+            }
+        }
 
-        @media (max-width: 768px) {{
-            .cover h1 {{
+        @media (max-width: 768px) {
+            .cover h1 {
                 font-size: 2em;
-            }}
-            .page-title {{
+            }
+            .page-title {
                 font-size: 1.6em;
-            }}
-            .kid-text {{
+            }
+            .kid-text {
                 font-size: 1.4em;
-            }}
-            .page {{
+            }
+            .page {
                 padding: 20px;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+# str.format template: literal braces are doubled, BOOK_CSS is substituted as {css}
+BOOK_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+{css}    </style>
 </head>
 <body>
     <div class="container">
         <!-- Cover Page -->
         <div class="cover">
-            <h1>📚 {book.title}</h1>
+            <h1>📚 {title}</h1>
             <div class="subtitle">An Educational Adventure for Curious Kids!</div>
             <div class="metadata">
-                <span>👶 Age {book.target_age}+</span>
-                <span>📄 {len(book.pages)} Pages</span>
-                <span>🎯 {book.topic}</span>
+                <span>👶 Age {target_age}+</span>
+                <span>📄 {page_count} Pages</span>
+                <span>🎯 {topic}</span>
             </div>
-            <div class="qa-score">⭐ Quality Score: {book.qa_score}/100</div>
+            <div class="qa-score">⭐ Quality Score: {qa_score}/100</div>
 
             <div class="objectives">
                 <h3>🎓 What You'll Learn</h3>
@@ -903,7 +1120,114 @@ def generate_html_book(book: FinalBook) -> str:
 </body>
 </html>"""
 
-    return html
+
+class PageColumns(NamedTuple):
+    """Per-page fields as parallel lists in page order, for assembling the HTML."""
+
+    page_numbers: list[int]
+    titles: list[str]
+    concepts: list[str]
+    kid_texts: list[str]
+    parent_guides: list[str]
+    vocab_lists: list[list[str]]
+    image_urls: list[str]
+
+    @classmethod
+    def from_pages(cls, pages: list[CompletePage]) -> "PageColumns":
+        return cls(
+            [p.page_number for p in pages],
+            [p.title for p in pages],
+            [p.concept for p in pages],
+            [p.kid_text for p in pages],
+            [p.parent_guide for p in pages],
+            [p.key_vocabulary for p in pages],
+            [p.image_url for p in pages],
+        )
+
+
+def generate_html_book(
+    book: FinalBook, image_srcs: list[str] | None = None, columns: PageColumns | None = None
+) -> str:
+    """Generate a beautiful, interactive HTML book.
+
+    columns holds the page fields in page order (derived from book.pages if omitted) and
+    image_srcs each page's <img> source in that order. If image_srcs is omitted, local
+    images are linked by file name (the HTML is written next to them).
+    """
+    if columns is None:
+        columns = PageColumns.from_pages(book.pages)
+    if image_srcs is None:
+        image_srcs = [image_src_for_html(url) for url in columns.image_urls]
+    page_count = len(columns.page_numbers)
+
+    # Build pages HTML
+    page_parts: list[str] = []
+    for page_number, title, concept, kid_text, parent_guide, key_vocabulary, image_src in zip(
+        columns.page_numbers,
+        columns.titles,
+        columns.concepts,
+        columns.kid_texts,
+        columns.parent_guides,
+        columns.vocab_lists,
+        image_srcs,
+    ):
+        # Highlight vocabulary in kid text (one pass; longest words first so
+        # "photosynthesis" wins over "photo", and whole words only)
+        kid_text_highlighted = kid_text
+        vocab_words = sorted((v for v in key_vocabulary if v), key=len, reverse=True)
+        if vocab_words:
+            vocab_pattern = re.compile(r"\b(" + "|".join(map(re.escape, vocab_words)) + r")\b")
+            kid_text_highlighted = vocab_pattern.sub(
+                lambda m: f'<span class="vocab" title="Key word!">{m.group(0)}</span>',
+                kid_text_highlighted,
+            )
+
+        page_parts.append(f"""
+        <section class="page" id="page-{page_number}">
+            <div class="page-content">
+                <div class="page-number">Page {page_number} of {page_count}</div>
+                <h2 class="page-title">{title}</h2>
+                <div class="concept-badge">💡 {concept}</div>
+
+                <div class="image-container">
+                    <img src="{image_src}" alt="{title}" class="page-image" loading="lazy">
+                </div>
+
+                <div class="kid-text">
+                    <p>{kid_text_highlighted}</p>
+                </div>
+
+                <details class="parent-guide">
+                    <summary>📖 Parent Discussion Guide</summary>
+                    <div class="guide-content">
+                        <p>{parent_guide}</p>
+                        <div class="vocabulary">
+                            <strong>Key Vocabulary:</strong> {', '.join(key_vocabulary)}
+                        </div>
+                    </div>
+                </details>
+            </div>
+        </section>
+        """)
+    pages_html = "".join(page_parts)
+
+    # Build learning objectives list
+    objectives_html = "\n".join([f"<li>{obj}</li>" for obj in book.learning_objectives])
+
+    return BOOK_HTML_TEMPLATE.format(
+        title=book.title,
+        target_age=book.target_age,
+        topic=book.topic,
+        qa_score=book.qa_score,
+        page_count=page_count,
+        objectives_html=objectives_html,
+        pages_html=pages_html,
+        css=BOOK_CSS,
+    )
+
+
+# Strong references to fire-and-forget tasks so they aren't garbage-collected mid-run
+_background_tasks: set[asyncio.Task] = set()
 
 
 @executor(id="book_compiler")
@@ -916,40 +1240,55 @@ async def book_compiler(qa_result: QAResult, ctx: WorkflowContext[Never, FinalBo
     page_images: dict[int, str] = await ctx.get_shared_state("book:page_images")
     topic: str = await ctx.get_shared_state("book:topic")
 
-    # Build complete pages
-    complete_pages = []
-    for page_plan in structure.pages:
-        page_num = page_plan.page_number
-        content = pages_content[page_num]
-        image_url = page_images[page_num]
-
-        complete_pages.append(
-            CompletePage(
-                page_number=page_num,
-                title=page_plan.title,
-                concept=page_plan.concept,
-                kid_text=content.kid_text,
-                parent_guide=content.parent_guide,
-                key_vocabulary=content.key_vocabulary,
-                image_url=image_url,
-            )
+    # Gather page fields into parallel lists, sorting the plans by page number once
+    plans = sorted(structure.pages, key=lambda p: p.page_number)
+    contents = [pages_content[p.page_number] for p in plans]
+    columns = PageColumns(
+        page_numbers=[p.page_number for p in plans],
+        titles=[p.title for p in plans],
+        concepts=[p.concept for p in plans],
+        kid_texts=[c.kid_text for c in contents],
+        parent_guides=[c.parent_guide for c in contents],
+        vocab_lists=[c.key_vocabulary for c in contents],
+        image_urls=[page_images[p.page_number] for p in plans],
+    )
+
+    # Build complete pages. Every field was validated when parsed from agent output,
+    # so model_construct skips a second validation pass.
+    complete_pages = [
+        CompletePage.model_construct(
+            page_number=page_number,
+            title=title,
+            concept=concept,
+            kid_text=kid_text,
+            parent_guide=parent_guide,
+            key_vocabulary=key_vocabulary,
+            image_url=image_url,
         )
+        for page_number, title, concept, kid_text, parent_guide, key_vocabulary, image_url in zip(*columns)
+    ]
 
     # Create final book
-    final_book = FinalBook(
+    final_book = FinalBook.model_construct(
         title=structure.book_title,
         topic=topic,
         target_age=structure.target_age,
         learning_objectives=structure.learning_objectives,
-        pages=sorted(complete_pages, key=lambda p: p.page_number),
+        pages=complete_pages,
         qa_score=qa_result.overall_score,
     )
 
     # Generate HTML book
-    html_content = generate_html_book(final_book)
+    if SELF_CONTAINED_HTML:
+        # Read and encode local images off the event loop, all pages in parallel
+        image_srcs = await asyncio.gather(
+            *[asyncio.to_thread(image_to_data_url, url) for url in columns.image_urls]
+        )
+    else:
+        image_srcs = [image_src_for_html(url) for url in columns.image_urls]
+    html_content = generate_html_book(final_book, image_srcs, columns)
 
     # Create URL-safe filename from topic
-    import re
     safe_topic = re.sub(r'[^\w\s-]', '', topic)  # Remove special chars
     safe_topic = re.sub(r'[-\s]+', '_', safe_topic)  # Replace spaces/dashes with underscore
     safe_topic = safe_topic.strip('_').lower()  # Clean up and lowercase
@@ -957,8 +1296,7 @@ async def book_compiler(qa_result: QAResult, ctx: WorkflowContext[Never, FinalBo
     html_filename = f"book_{safe_topic}.html"
     html_path = os.path.join(os.path.dirname(__file__), html_filename)
 
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    await asyncio.to_thread(write_text_file, html_path, html_content)
 
     # Show completion info
     iterations = await ctx.get_shared_state("qa_iterations") or 1
@@ -967,9 +1305,12 @@ async def book_compiler(qa_result: QAResult, ctx: WorkflowContext[Never, FinalBo
     print(f"📚 HTML book generated: {html_path}")
     print(f"📊 Final QA Score: {qa_result.overall_score}/100")
 
-    # Auto-open in browser
-    import webbrowser
-    webbrowser.open(f'file://{os.path.abspath(html_path)}')
+    # Auto-open in browser from a worker thread; don't hold up the workflow output for it
+    browser_task = asyncio.create_task(
+        asyncio.to_thread(webbrowser.open, f'file://{os.path.abspath(html_path)}')
+    )
+    _background_tasks.add(browser_task)
+    browser_task.add_done_callback(_background_tasks.discard)
     print(f"🌐 Opening book in browser...")
 
     # Yield final output
@@ -984,8 +1325,6 @@ async def book_compiler(qa_result: QAResult, ctx: WorkflowContext[Never, FinalBo
 @executor(id="topic_handler")
 async def topic_handler(topic: str, ctx: WorkflowContext[Any]) -> None:
     """Handle initial topic input and store in shared state."""
-    from agent_framework import AgentExecutorRequest, ChatMessage, Role
-
     # Initialize workflow state
     await ctx.set_shared_state("book:topic", topic)
     await ctx.set_shared_state("qa_iterations", 0)  # Initialize retry counter
@@ -1034,6 +1373,38 @@ Make it memorable and exciting for young learners!""",
     response_format=BookStructure,
 )
 
+# Content Generator Agent (used inside the content_generator executor)
+CONTENT_GEN_INSTRUCTIONS = """You are a children's book writer specializing in educational content for 6-year-olds.
+
+Kid Text (2-3 simple sentences):
+- Maximum 10 words per sentence
+- Use story/narrative format with engaging characters
+- Avoid complex words (or explain them simply inline)
+- Make it fun and memorable!
+
+Parent Guide:
+- Provide 3-5 detailed discussion points
+- Suggest open-ended questions to ask the child
+- Give deeper explanations of the concept with examples
+- Include real-world connections and activities to try together
+- Reference additional learning resources (books, videos, experiments)
+
+Key Vocabulary:
+- List 2-4 important words from this page
+- These will be highlighted for parents to explain"""
+
+content_gen_agent = chat_client.create_agent(
+    name="ContentGenerator",
+    instructions=CONTENT_GEN_INSTRUCTIONS,
+    response_format=PageContent,
+)
+
+# Part of the content cache key, so a prompt or model change doesn't serve stale pages
+CONTENT_GEN_FINGERPRINT = {
+    "model": chat_client.model_id,
+    "instructions": hashlib.sha256(CONTENT_GEN_INSTRUCTIONS.encode()).hexdigest(),
+}
+
 # Book QA Agent
 book_qa = chat_client.create_agent(
     name="BookQA",
@@ -1065,7 +1436,12 @@ Evaluate the COMPLETE book based on:
    - Parent guides helpful and detailed?
    - Good discussion questions?
 
-Provide constructive feedback. Be thorough but fair. Score 0-100.""",
+Provide constructive feedback. Be thorough but fair. Score 0-100.
+
+If the book is not approved, list the page numbers that need rework in failing_page_numbers.
+Leave it empty only if every page must be regenerated.
+Set retry_reason to "text_only" if only the text needs work, "images" if only the images do,
+and "both" otherwise.""",
     response_format=QAResult,
 )
 
@@ -1086,9 +1462,9 @@ workflow = (
     .add_fan_out_edges(extract_structure, [content_generator, image_generator])
     # Fan-in: both complete → QA aggregator
     .add_fan_in_edges([content_generator, image_generator], qa_aggregator)
-    # QA and decision
-    .add_edge(qa_aggregator, book_qa)
-    .add_edge(book_qa, extract_qa_result)
+    # QA (streamed review) and decision
+    .add_edge(qa_aggregator, book_qa_review)
+    .add_edge(book_qa_review, extract_qa_result)
     # extract_qa_result handles routing: approved → compiler, not approved → generators (retry loop)
     .add_edge(extract_qa_result, book_compiler)
     .add_fan_out_edges(extract_qa_result, [content_generator, image_generator])
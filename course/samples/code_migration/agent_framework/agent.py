@@ -5,15 +5,31 @@ Helps developers migrate code from other frameworks (AutoGen, Semantic Kernel, L
 to Microsoft Agent Framework by providing relevant samples and migration guidance.
 """
 
+import asyncio
+import hashlib
+import heapq
 import json
 import os
+import time
+from collections import Counter, OrderedDict, defaultdict
+from itertools import chain
 from pathlib import Path
-from typing import Annotated
-from urllib.request import urlopen
+from typing import Annotated, NamedTuple
 
+import httpx
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing and serialization
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorized tag scoring for large indices
+    np = None
+
 # Index file location (same directory as this script)
 INDEX_FILE = Path(__file__).parent / "index.json"
 GITHUB_RAW_URL = "https://raw.githubusercontent.com/microsoft/agent-framework/main"
@@ -23,6 +39,8 @@ def load_index() -> dict:
     """Load sample index from local file."""
     if INDEX_FILE.exists():
         try:
+            if orjson is not None:
+                return orjson.loads(INDEX_FILE.read_bytes())
             with open(INDEX_FILE, "r") as f:
                 return json.load(f)
         except Exception as e:
@@ -41,62 +59,161 @@ def load_index() -> dict:
     return {"version": "1.0", "python": [], "dotnet": []}
 
 
-# Load the index once at module level
-SAMPLE_INDEX = load_index()
+def _normalize(sample: dict) -> None:
+    """Fill in optional fields so the rest of the module can index them directly."""
+    sample.setdefault("tags", [])
+    sample.setdefault("description", "No description available")
+    sample.setdefault("category", "uncategorized")
+    sample.setdefault("type", "code")
+
+
+# Set to pretty-print get_samples output (compact JSON is smaller and all the model needs)
+PRETTY_JSON = os.environ.get("MIGRATION_ASSISTANT_PRETTY_JSON") == "1"
+
+
+def _dumps_compact(obj) -> str:
+    """Serialize to compact JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+class PreparedIndex(NamedTuple):
+    """Sample index plus the lookup tables derived from it."""
+
+    samples: dict
+    tag_postings: dict[str, dict[str, list[int]]]  # language -> lowercase tag -> positions
+    by_name: dict[str, dict[str, dict]]  # language -> name -> sample (first occurrence wins)
+    metadata: dict  # categories, tags and counts for the agent instructions
+
+
+def prepare_index(index: dict) -> PreparedIndex:
+    """Normalize samples and build every lookup table in a single pass over the index."""
+    tag_postings: dict[str, dict[str, list[int]]] = {}
+    by_name: dict[str, dict[str, dict]] = {}
+    categories: dict[str, list[str]] = {}
+    sample_counts: dict[str, int] = {}
+    all_tags: set[str] = set()
+
+    for language in ("python", "dotnet"):
+        samples = index.get(language, [])
+        language_postings = defaultdict(list)
+        language_by_name: dict[str, dict] = {}
+        language_categories: set[str] = set()
 
+        for position, sample in enumerate(samples):
+            _normalize(sample)
+            tags = sample["tags"]
+            tags_lc = frozenset(t.lower() for t in tags)
+            sample["_tags_lc"] = tags_lc
+            sample["_raw_url"] = f"{GITHUB_RAW_URL}/{sample['file_path']}"
+            # Shape returned by get_samples (excludes file_path and processed fields)
+            sample["_public"] = {
+                "name": sample["name"],
+                "category": sample["category"],
+                "description": sample["description"],
+                "tags": tags,
+                "github_url": sample["github_url"],
+            }
+            sample["_json"] = _dumps_compact(sample["_public"])
 
-def extract_metadata_from_index(index: dict) -> dict:
-    """Extract categories, tags, and other metadata from the index for agent instructions."""
+            for tag in tags_lc:
+                language_postings[tag].append(position)
+            language_by_name.setdefault(sample["name"], sample)
+            if sample["category"]:
+                language_categories.add(sample["category"])
+            all_tags.update(tags)
+
+        tag_postings[language] = dict(language_postings)
+        by_name[language] = language_by_name
+        categories[language] = sorted(language_categories)
+        sample_counts[language] = len(samples)
+
+    # Sorted lists for consistent display
     metadata = {
-        "python_categories": set(),
-        "dotnet_categories": set(),
-        "all_tags": set(),
-        "sample_counts": {"python": 0, "dotnet": 0},
+        "python_categories": categories["python"],
+        "dotnet_categories": categories["dotnet"],
+        "all_tags": sorted(all_tags),
+        "sample_counts": sample_counts,
     }
+    return PreparedIndex(index, tag_postings, by_name, metadata)
 
-    # Extract Python metadata
-    for sample in index.get("python", []):
-        if sample.get("category"):
-            metadata["python_categories"].add(sample["category"])
-        for tag in sample.get("tags", []):
-            metadata["all_tags"].add(tag)
-        metadata["sample_counts"]["python"] += 1
 
-    # Extract .NET metadata
-    for sample in index.get("dotnet", []):
-        if sample.get("category"):
-            metadata["dotnet_categories"].add(sample["category"])
-        for tag in sample.get("tags", []):
-            metadata["all_tags"].add(tag)
-        metadata["sample_counts"]["dotnet"] += 1
+# Languages with more samples than this are scored with NumPy tag bitmasks
+BITMASK_MIN_SAMPLES = 500
 
-    # Convert sets to sorted lists for consistent display
-    metadata["python_categories"] = sorted(metadata["python_categories"])
-    metadata["dotnet_categories"] = sorted(metadata["dotnet_categories"])
-    metadata["all_tags"] = sorted(metadata["all_tags"])
 
-    return metadata
+def build_tag_masks(index: dict) -> tuple[dict[str, int], dict]:
+    """Pack each sample's lowercase tags into uint64 bitmask rows for large languages.
 
+    Returns (tag -> bit id, language -> array of shape (samples, lanes)). Both are
+    empty when NumPy is unavailable or no language exceeds BITMASK_MIN_SAMPLES.
+    """
+    if np is None:
+        return {}, {}
+    large = [lang for lang in ("python", "dotnet") if len(index.get(lang, [])) > BITMASK_MIN_SAMPLES]
+    if not large:
+        return {}, {}
+
+    vocabulary = sorted({tag for lang in large for sample in index[lang] for tag in sample["_tags_lc"]})
+    tag_ids = {tag: i for i, tag in enumerate(vocabulary)}
+    lanes = max(1, (len(vocabulary) + 63) // 64)
+
+    masks = {}
+    for lang in large:
+        rows = np.zeros((len(index[lang]), lanes), dtype=np.uint64)
+        for position, sample in enumerate(index[lang]):
+            for tag in sample["_tags_lc"]:
+                bit = tag_ids[tag]
+                rows[position, bit >> 6] |= np.uint64(1 << (bit & 63))
+        masks[lang] = rows
+    return tag_ids, masks
 
-# Extract metadata for agent instructions
-INDEX_METADATA = extract_metadata_from_index(SAMPLE_INDEX)
+
+# Load the index once at module level
+SAMPLE_INDEX, TAG_POSTINGS, SAMPLE_BY_NAME, INDEX_METADATA = prepare_index(load_index())
+TAG_IDS, TAG_MASKS = build_tag_masks(SAMPLE_INDEX)
+
+
+# Joined once here and shared by the tool docstring and the agent instructions
+_PY_CATS_STR = ", ".join(INDEX_METADATA["python_categories"]) or "none available"
+_DOTNET_CATS_STR = ", ".join(INDEX_METADATA["dotnet_categories"]) or "none available"
+_ALL_TAGS_STR = ", ".join(INDEX_METADATA["all_tags"]) or "none available"
 
 
 def format_categories_and_tags() -> tuple[str, str]:
     """Format categories and tags for display in tool docstrings."""
-    python_cats = ", ".join(INDEX_METADATA["python_categories"]) if INDEX_METADATA["python_categories"] else "none available"
-    dotnet_cats = ", ".join(INDEX_METADATA["dotnet_categories"]) if INDEX_METADATA["dotnet_categories"] else "none available"
-    all_tags = ", ".join(INDEX_METADATA["all_tags"]) if INDEX_METADATA["all_tags"] else "none available"
-
-    categories_text = f"""Available Python categories: {python_cats}
+    categories_text = f"""Available Python categories: {_PY_CATS_STR}
 
-    Available .NET categories: {dotnet_cats}"""
+    Available .NET categories: {_DOTNET_CATS_STR}"""
 
-    tags_text = f"""Available tags: {all_tags}"""
+    tags_text = f"""Available tags: {_ALL_TAGS_STR}"""
 
     return categories_text, tags_text
 
 
+def _bitmask_positions(masks, tags_set: frozenset[str], match_mode: str) -> list[int]:
+    """Score every sample at once against the query tags using the packed bitmasks."""
+    query = np.zeros(masks.shape[1], dtype=np.uint64)
+    for tag in tags_set:
+        bit = TAG_IDS.get(tag)
+        if bit is None:
+            if match_mode == "all":
+                return []  # No sample carries this tag
+            continue
+        query[bit >> 6] |= np.uint64(1 << (bit & 63))
+
+    hits = masks & query
+    if match_mode == "all":
+        return np.flatnonzero((hits == query).all(axis=1)).tolist()
+
+    # Popcount of the matching bits = number of matching tags
+    scores = np.unpackbits(hits.view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+    # Stable sort keeps index order among equal scores, matching the posting-list path
+    order = np.argsort(-scores, kind="stable")
+    return order[: np.count_nonzero(scores)].tolist()
+
+
 def get_samples(
     language: Annotated[str, "The target language: 'python' or 'dotnet'"],
     tags: Annotated[list[str], "Filter tags (see docstring for available tags dynamically loaded from index)"],
@@ -111,51 +228,48 @@ def get_samples(
 
     # Filter by tags with relevance scoring
     if tags:
-        filtered = []
-        tags_lower = [tag.lower() for tag in tags]
-
-        for sample in samples:
-            sample_tags_lower = [t.lower() for t in sample.get("tags", [])]
-
-            if match_mode == "all":
-                # AND logic - sample must have ALL specified tags
-                if all(tag in sample_tags_lower for tag in tags_lower):
-                    # Score is the number of matching tags
-                    score = len([t for t in tags_lower if t in sample_tags_lower])
-                    filtered.append((score, sample))
+        tags_set = frozenset(tag.lower() for tag in tags)
+        postings = TAG_POSTINGS.get(language, {})
+        masks = TAG_MASKS.get(language)
+
+        if masks is not None:
+            # Large index - vectorized scoring over all samples
+            positions = _bitmask_positions(masks, tags_set, match_mode)
+        elif match_mode == "all":
+            # AND logic - walk the shortest posting list and keep samples with ALL tags
+            shortest = min((postings.get(tag, []) for tag in tags_set), key=len)
+            positions = [i for i in shortest if tags_set <= samples[i]["_tags_lc"]]
+        else:
+            # OR logic (default) - score is the number of matching tags, so count
+            # how many of the query tags' posting lists each sample appears in
+            scores = Counter(chain.from_iterable(postings.get(tag, ()) for tag in tags_set))
+            # More matches = higher relevance; ties keep index order
+            def rank(i: int) -> tuple[int, int]:
+                return (-scores[i], i)
+
+            if 0 < n < len(scores):
+                # Only the top n are returned, so keep a bounded heap instead of sorting all
+                positions = heapq.nsmallest(n, scores, key=rank)
             else:
-                # OR logic (default) - sample must have ANY specified tag
-                matching_tags = [t for t in tags_lower if t in sample_tags_lower]
-                if matching_tags:
-                    # Score is the number of matching tags (more matches = higher relevance)
-                    score = len(matching_tags)
-                    filtered.append((score, sample))
-
-        # Sort by score (descending) - samples with more tag matches appear first
-        filtered.sort(key=lambda x: x[0], reverse=True)
-
-        # Extract just the samples (remove scores)
-        filtered = [sample for score, sample in filtered]
+                positions = sorted(scores, key=rank)
+
+        filtered = [samples[i] for i in positions]
     else:
         filtered = samples
 
     # Limit to n results
     results = filtered[:n]
 
-    # Format output (exclude file_path and processed fields)
-    output = []
-    for sample in results:
-        output.append(
-            {
-                "name": sample["name"],
-                "category": sample["category"],
-                "description": sample.get("description", "No description available"),
-                "tags": sample.get("tags", []),
-                "github_url": sample["github_url"],
-            }
-        )
+    if PRETTY_JSON:
+        output = [sample["_public"] for sample in results]
+        payload = {"count": len(output), "samples": output}
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(payload, indent=2)
 
-    return json.dumps({"count": len(output), "samples": output}, indent=2)
+    # Each sample's JSON is serialized once at load time; only the envelope is built here
+    samples_json = ",".join(sample["_json"] for sample in results)
+    return f'{{"count":{len(results)},"samples":[{samples_json}]}}'
 
 
 # Set dynamic docstring for get_samples after function definition
@@ -185,7 +299,80 @@ Returns:
 """
 
 
-def fetch_sample(
+# Shared client so repeated GitHub fetches reuse keep-alive connections.
+# Redirects are followed like urllib did, e.g. raw URLs of renamed repos or branches.
+_HTTP = httpx.AsyncClient(
+    timeout=10.0, follow_redirects=True, limits=httpx.Limits(max_keepalive_connections=32)
+)
+
+# Fetched file contents, keyed by raw URL: url -> (expires_at, content)
+CONTENT_CACHE_TTL = 900
+CONTENT_CACHE_SIZE = 512
+_content_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+# On-disk copies of fetched files, revalidated with their ETag once the memory entry expires
+_CACHE_DIR = Path(__file__).parent / ".sample_cache"
+
+
+def _disk_cache_paths(raw_url: str) -> tuple[Path, Path]:
+    """Return the (body, metadata) cache file paths for a raw URL."""
+    key = hashlib.sha256(raw_url.encode()).hexdigest()[:16]
+    return _CACHE_DIR / key, _CACHE_DIR / f"{key}.meta"
+
+
+def _read_disk_cache(raw_url: str) -> tuple[str | None, bytes | None]:
+    """Return the cached (etag, body) for a raw URL, or (None, None) if absent."""
+    body_path, meta_path = _disk_cache_paths(raw_url)
+    try:
+        etag = json.loads(meta_path.read_text())["etag"]
+        return etag, body_path.read_bytes()
+    except (OSError, ValueError, KeyError):
+        return None, None
+
+
+def _write_disk_cache(raw_url: str, etag: str, data: bytes) -> None:
+    """Store a fetched body and its ETag (best-effort)."""
+    body_path, meta_path = _disk_cache_paths(raw_url)
+    try:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        body_path.write_bytes(data)
+        meta_path.write_text(json.dumps({"url": raw_url, "etag": etag}))
+    except OSError:
+        pass
+
+
+async def fetch_raw_content(raw_url: str) -> str:
+    """Fetch a file from GitHub, serving recent fetches from memory and unchanged files from disk."""
+    now = time.monotonic()
+    cached = _content_cache.get(raw_url)
+    if cached and cached[0] > now:
+        _content_cache.move_to_end(raw_url)
+        return cached[1]
+
+    # Disk I/O runs in a worker thread so concurrent fetches don't queue behind it
+    etag, body = await asyncio.to_thread(_read_disk_cache, raw_url)
+
+    headers = {"If-None-Match": etag} if etag else {}
+    response = await _HTTP.get(raw_url, headers=headers)
+    if response.status_code == 304 and body is not None:
+        data = body
+    else:
+        # Only a successful response is cached; anything else raises here
+        response.raise_for_status()
+        data = response.content
+        etag = response.headers.get("etag")
+        if etag:
+            await asyncio.to_thread(_write_disk_cache, raw_url, etag, data)
+    content = data.decode("utf-8")
+
+    _content_cache[raw_url] = (now + CONTENT_CACHE_TTL, content)
+    _content_cache.move_to_end(raw_url)
+    while len(_content_cache) > CONTENT_CACHE_SIZE:
+        _content_cache.popitem(last=False)
+    return content
+
+
+async def fetch_sample(
     sample_name: Annotated[str, "Name of the sample to fetch (from get_samples results)"],
     language: Annotated[str, "Language of the sample: 'python' or 'dotnet'"],
 ) -> str:
@@ -208,47 +395,41 @@ def fetch_sample(
         return f"Error: Language '{language}' not found in index"
 
     # Find the sample
-    sample = None
-    for s in SAMPLE_INDEX[language]:
-        if s["name"] == sample_name:
-            sample = s
-            break
+    sample = SAMPLE_BY_NAME.get(language, {}).get(sample_name)
 
     if not sample:
         available = [s["name"] for s in SAMPLE_INDEX[language][:10]]
         return f"Error: Sample '{sample_name}' not found.\n\nAvailable samples (first 10): {', '.join(available)}"
 
     # Fetch content from GitHub raw URL
-    file_path = sample["file_path"]
-    raw_url = f"{GITHUB_RAW_URL}/{file_path}"
+    raw_url = sample["_raw_url"]
 
     try:
-        with urlopen(raw_url, timeout=10) as response:
-            content = response.read().decode('utf-8')
+        content = await fetch_raw_content(raw_url)
 
         # Determine content type based on sample type
-        is_documentation = sample.get("type") == "documentation"
+        is_documentation = sample["type"] == "documentation"
         content_label = "DOCUMENTATION" if is_documentation else "CODE"
 
         return f"""{'Documentation' if is_documentation else 'Sample'}: {sample_name}
 Category: {sample['category']}
-Description: {sample.get('description', 'N/A')}
-Tags: {', '.join(sample.get('tags', []))}
+Description: {sample['description']}
+Tags: {', '.join(sample['tags'])}
 GitHub: {sample['github_url']}
 
 --- {content_label} ---
 {content}
 """
     except Exception as e:
-        return f"Error fetching {'documentation' if sample.get('type') == 'documentation' else 'sample'} from GitHub: {e}\n\nURL: {raw_url}\n\nTip: Check your internet connection or try viewing directly at: {sample['github_url']}"
+        return f"Error fetching {'documentation' if sample['type'] == 'documentation' else 'sample'} from GitHub: {e}\n\nURL: {raw_url}\n\nTip: Check your internet connection or try viewing directly at: {sample['github_url']}"
 
 
 # Build dynamic instructions from index metadata
 def build_agent_instructions() -> str:
     """Build agent instructions with dynamic metadata from index."""
-    python_cats = ", ".join(INDEX_METADATA["python_categories"]) if INDEX_METADATA["python_categories"] else "none available"
-    dotnet_cats = ", ".join(INDEX_METADATA["dotnet_categories"]) if INDEX_METADATA["dotnet_categories"] else "none available"
-    all_tags = ", ".join(INDEX_METADATA["all_tags"]) if INDEX_METADATA["all_tags"] else "none available"
+    python_cats = _PY_CATS_STR
+    dotnet_cats = _DOTNET_CATS_STR
+    all_tags = _ALL_TAGS_STR
 
     python_count = INDEX_METADATA["sample_counts"]["python"]
     dotnet_count = INDEX_METADATA["sample_counts"]["dotnet"]
@@ -434,11 +615,15 @@ def build_agent_instructions() -> str:
     """
 
 
+# Built once at import; the index metadata doesn't change while the agent runs
+AGENT_INSTRUCTIONS = build_agent_instructions()
+
+
 # Agent instance following Agent Framework conventions
 agent = ChatAgent(
     name="MigrationAssistant",
     description="A helpful agent that assists developers in migrating their code to Microsoft Agent Framework",
-    instructions=build_agent_instructions(),
+    instructions=AGENT_INSTRUCTIONS,
     chat_client=AzureOpenAIChatClient(
         api_key=os.environ.get("AZURE_OPENAI_API_KEY", ""),
     ),
@@ -3,42 +3,47 @@
 
 import asyncio
 import os
+from operator import add, mul, sub, truediv
 from typing import Annotated
 
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
 
+# Dispatch table for the calculator tool
+_OPS = {
+    '+': add,
+    '-': sub,
+    '*': mul,
+    '/': truediv,
+}
+
+
 def calculator(a: float, b: float, operator: str) -> str:
     """Perform basic arithmetic operations."""
-    try:
-        if operator == '+':
-            return str(a + b)
-        elif operator == '-':
-            return str(a - b)
-        elif operator == '*':
-            return str(a * b)
-        elif operator == '/':
-            if b == 0:
-                return 'Error: Division by zero'
-            return str(a / b)
-        else:
-            return 'Error: Invalid operator. Please use +, -, *, or /'
-    except Exception as e:
-        return f'Error: {str(e)}'
-
- 
-async def main() -> None:
+    fn = _OPS.get(operator)
+    if fn is None:
+        return 'Error: Invalid operator. Please use +, -, *, or /'
+    if operator == '/' and b == 0:
+        return 'Error: Division by zero'
+    return str(fn(a, b))
+
+
 # Agent instance following Agent Framework conventions
-    agent = ChatAgent(
-        name="AzureWeatherAgent",
-        description="A helpful assistant",
-        instructions="""
-        A helpful assistant""",
-        chat_client=AzureOpenAIChatClient(),
-        tools=[calculator],
-    )
+agent = ChatAgent(
+    name="AzureWeatherAgent",
+    description="A helpful assistant",
+    instructions="""
+    A helpful assistant""",
+    chat_client=AzureOpenAIChatClient(),
+    tools=[calculator],
+)
+
+
+async def main() -> None:
     result = await agent.run("What is the result of 545.34567 * 34555.34?")
     print(result)
 
-asyncio.run(main())
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,27 +1,29 @@
 # pip install -U autogen-agentchat autogen-ext[openai]
 import asyncio
+from operator import add, mul, sub, truediv
+
 from autogen_agentchat.agents import AssistantAgent 
 from autogen_agentchat.ui import Console
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
 
+# Dispatch table for the calculator tool
+_OPS = {
+    '+': add,
+    '-': sub,
+    '*': mul,
+    '/': truediv,
+}
+
+
 def calculator(a: float, b: float, operator: str) -> str:
     """Perform basic arithmetic operations."""
-    try:
-        if operator == '+':
-            return str(a + b)
-        elif operator == '-':
-            return str(a - b)
-        elif operator == '*':
-            return str(a * b)
-        elif operator == '/':
-            if b == 0:
-                return 'Error: Division by zero'
-            return str(a / b)
-        else:
-            return 'Error: Invalid operator. Please use +, -, *, or /'
-    except Exception as e:
-        return f'Error: {str(e)}'
+    fn = _OPS.get(operator)
+    if fn is None:
+        return 'Error: Invalid operator. Please use +, -, *, or /'
+    if operator == '/' and b == 0:
+        return 'Error: Division by zero'
+    return str(fn(a, b))
 
 
 async def main() -> None: 
@@ -1,29 +1,53 @@
 # server.py
+import html
 import os
+import re
+import time
 from mcp.server.fastmcp import FastMCP
-import requests
+import httpx
 
 mcp = FastMCP("TechCrunch News Server", host=os.environ.get("MCP_SERVER_HOST", "localhost"), port=int(os.environ.get("MCP_SERVER_PORT", 8011)))
 
+# One pooled client for all tool calls, so concurrent fetches reuse connections
+_client = httpx.AsyncClient(timeout=5, follow_redirects=True, limits=httpx.Limits(max_keepalive_connections=20))
+
+# The feeds change slowly, so a category fetched in the last minute is served from memory
+NEWS_CACHE_TTL = 60  # seconds
+_news_cache: dict[str, tuple[float, str]] = {}
+
+
+# Visible text is recovered with a few byte-level regex passes instead of building a DOM
+_SKIP_RE = re.compile(rb'<!--.*?-->|<(script|style|noscript)\b.*?</\1\s*>', re.S | re.I)
+_TAG_RE = re.compile(rb'<[^>]+>')
+_WS_RE = re.compile(rb'\s+')
+
+
+def _page_text(content: bytes) -> str:
+    """Return the first 1000 characters of a page's visible text."""
+    stripped = _WS_RE.sub(b' ', _TAG_RE.sub(b' ', _SKIP_RE.sub(b' ', content))).strip()
+    text = html.unescape(stripped.decode('utf-8', 'replace'))
+    return text[:1000] + ("..." if len(text) > 1000 else "")
+
+
 @mcp.tool(title="Fetch from TechCrunch")
-def fetch_from_techcrunch(category: str = "latest") -> str:
+async def fetch_from_techcrunch(category: str = "latest") -> str:
     """Fetch the latest news from TechCrunch for a given category."""
     allowed = {"ai", "startup", "security", "venture", "latest"}
     cat = category.lower()
     if cat not in allowed:
         cat = "latest"
     url = f"https://techcrunch.com/tag/{cat}/" if cat != "latest" else "https://techcrunch.com/"
-    
+
+    cached = _news_cache.get(cat)
+    if cached and time.monotonic() - cached[0] < NEWS_CACHE_TTL:
+        return cached[1]
+
     try:
-        response = requests.get(url)
-        if response.ok:
-            try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.text, "html.parser")
-                text = soup.get_text(separator=' ', strip=True) 
-                return text  + ("..." if len(text) > 1000 else "")
-            except ImportError:
-                return response.text[:1000] + ("..." if len(response.text) > 1000 else "")
+        response = await _client.get(url)
+        if response.is_success:
+            text = _page_text(response.content)
+            _news_cache[cat] = (time.monotonic(), text)
+            return text
         return "Failed to fetch news."
     except Exception as e:
         print(f"Error fetching news: {str(e)}")
@@ -5,6 +5,10 @@ import requests
 
 mcp = FastMCP("TechCrunch News Server", host=os.environ.get("MCP_SERVER_HOST", "localhost"), port=int(os.environ.get("MCP_SERVER_PORT", 8011)))
 
+# One session for all tool calls, so the TCP/TLS connection to TechCrunch is kept alive and reused
+_session = requests.Session()
+_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=1))
+
 @mcp.tool(title="Fetch from TechCrunch")
 def fetch_from_techcrunch(category: str = "latest") -> str:
     """Fetch the latest news from TechCrunch for a given category."""
@@ -15,7 +19,7 @@ def fetch_from_techcrunch(category: str = "latest") -> str:
     url = f"https://techcrunch.com/tag/{cat}/" if cat != "latest" else "https://techcrunch.com/"
     
     try:
-        response = requests.get(url)
+        response = _session.get(url, timeout=5)
         if response.ok:
             from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, "html.parser")
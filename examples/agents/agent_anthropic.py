@@ -9,12 +9,11 @@ Requires: ANTHROPIC_API_KEY environment variable
 Run: python examples/agents/agent_anthropic.py
 """
 
-import asyncio
 import os
 from typing import List
 from pydantic import BaseModel
 
-from picoagents import Agent
+from picoagents import Agent, print_stream, run
 from picoagents.llm import AnthropicChatCompletionClient
 
 
@@ -46,14 +45,17 @@ async def main():
     print("1. Tool Calling Example:")
     print("-" * 40)
 
+    # One client for both agents, so every call reuses the same pooled connections
+    model_client = AnthropicChatCompletionClient(
+        model="claude-sonnet-4-5",  # Supports tool calling and structured outputs
+        api_key=os.getenv("ANTHROPIC_API_KEY")
+    )
+
     tool_agent = Agent(
         name="travel_assistant",
         description="A travel planning assistant",
         instructions="You are a helpful travel assistant with access to weather and flight information.",
-        model_client=AnthropicChatCompletionClient(
-            model="claude-sonnet-4-5",  # Supports all features
-            api_key=os.getenv("ANTHROPIC_API_KEY")
-        ),
+        model_client=model_client,
         tools=[get_weather, get_flight_info],
         example_tasks=[
             "What's the weather in San Francisco?",
@@ -62,11 +64,12 @@ async def main():
     )
 
     # Simple tool calling with streaming
-    async for event in tool_agent.run_stream(
-        "What's the weather in Paris and are there flights from San Francisco?",
-        stream_tokens=False
-    ):
-        print(event)
+    await print_stream(
+        tool_agent.run_stream(
+            "What's the weather in Paris and are there flights from San Francisco?",
+            stream_tokens=False
+        )
+    )
 
     print("\n" + "=" * 50 + "\n")
 
@@ -78,10 +81,7 @@ async def main():
         name="travel_planner",
         description="A travel recommendation agent",
         instructions="You are a travel expert. Provide detailed recommendations for destinations.",
-        model_client=AnthropicChatCompletionClient(
-            model="claude-sonnet-4-5",  # Required for structured outputs
-            api_key=os.getenv("ANTHROPIC_API_KEY")
-        ),
+        model_client=model_client,
         output_format=TravelRecommendation
     )
 
@@ -131,4 +131,4 @@ if __name__ == "__main__":
         print("Please set ANTHROPIC_API_KEY environment variable")
         print("export ANTHROPIC_API_KEY='your-key-here'")
     else:
-        asyncio.run(main())
\ No newline at end of file
+        run(main())
\ No newline at end of file
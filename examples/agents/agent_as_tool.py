@@ -3,10 +3,10 @@ Agent as Tool composition example.
 Shows how specialized agents can be used as tools by coordinator agents.
 """
 
-import asyncio
 import os
+from functools import cache
 
-from picoagents import Agent
+from picoagents import Agent, print_stream, run
 from picoagents.llm import AzureOpenAIChatCompletionClient
 
 
@@ -20,13 +20,16 @@ def analyze_data(data: str) -> str:
     return f"Analysis of '{data}': This shows positive trends with seasonal variations."
 
 
-# Create Azure client
-model_client = AzureOpenAIChatCompletionClient(
-    azure_deployment="gpt-4.1-mini",
-    azure_endpoint=os.environ.get(
-        "AZURE_OPENAI_ENDPOINT", "https://your-endpoint.openai.azure.com/"
-    ),
-)
+# The Azure client is built on first use (not when picoagentsui imports this file)
+# and shared by all three agents
+@cache
+def get_model_client() -> AzureOpenAIChatCompletionClient:
+    return AzureOpenAIChatCompletionClient(
+        azure_deployment="gpt-4.1-mini",
+        azure_endpoint=os.environ.get(
+            "AZURE_OPENAI_ENDPOINT", "https://your-endpoint.openai.azure.com/"
+        ),
+    )
 
 
 def tool_agents():
@@ -36,7 +39,7 @@ def tool_agents():
         name="weather_specialist",
         description="Specialized agent for weather information",
         instructions="You provide weather information using available tools. Be concise.",
-        model_client=model_client,
+        model_client_factory=get_model_client,
         tools=[get_weather],
     )
 
@@ -45,7 +48,7 @@ def tool_agents():
         name="data_analyst",
         description="Specialized agent for data analysis",
         instructions="You analyze data and provide insights. Be analytical.",
-        model_client=model_client,
+        model_client_factory=get_model_client,
         tools=[analyze_data],
     )
     return weather_agent, analysis_agent
@@ -65,11 +68,13 @@ agent = Agent(
     name="research_coordinator",
     description="Coordinates research tasks using specialist agents",
     instructions="You solve tasks by delegating to the relevant agents or tools",
-    model_client=model_client,
+    model_client_factory=get_model_client,
     tools=[
         weather_agent.as_tool(),  # Default: last message only
         analysis_agent.as_tool(result_strategy="last:2"),  # Last 2 messages
     ],
+    # Specialist calls from the same turn run concurrently; cap how many hit the API at once
+    max_parallel_tools=3,
     example_tasks=[
         "Get the current weather in New York and analyze recent sales data.",
         "Provide a brief report on the weather in San Francisco and its impact on outdoor events.",
@@ -85,9 +90,8 @@ async def main():
     complex_task = "Write a very brief health report on the current weather in SF."
 
     # Stream the coordinator's execution
-    async for event in agent.run_stream(complex_task):
-        print(event)
+    await print_stream(agent.run_stream(complex_task))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
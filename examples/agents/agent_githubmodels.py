@@ -7,10 +7,9 @@ Requires: GITHUB_TOKEN environment variable
 Run: python examples/agents/agent_githubmodels.py
 """
 
-import asyncio
 import os
 
-from picoagents import Agent, OpenAIChatCompletionClient
+from picoagents import Agent, OpenAIChatCompletionClient, print_stream, run
 
 
 def get_weather(location: str) -> str:
@@ -23,7 +22,8 @@ agent = Agent(
     name="github_models_assistant",
     description="An assistant powered by GitHub Models",
     instructions="You are a helpful assistant with weather access.",
-    model_client=OpenAIChatCompletionClient(
+    # Built on first run, so discovery works without GITHUB_TOKEN set
+    model_client_factory=lambda: OpenAIChatCompletionClient(
         model="openai/gpt-4.1-mini",
         api_key=os.getenv("GITHUB_TOKEN"),
         base_url="https://models.github.ai/inference"
@@ -40,15 +40,13 @@ async def main():
     """Run example with GitHub Models."""
     print("=== GitHub Models Agent ===\n")
 
-    async for event in agent.run_stream(
-        "What's the weather in Paris?",
-        stream_tokens=False
-    ):
-        print(event)
+    await print_stream(
+        agent.run_stream("What's the weather in Paris?", stream_tokens=False)
+    )
 
 
 if __name__ == "__main__":
     if not os.getenv("GITHUB_TOKEN"):
         print("Set GITHUB_TOKEN environment variable first")
     else:
-        asyncio.run(main())
\ No newline at end of file
+        run(main())
\ No newline at end of file
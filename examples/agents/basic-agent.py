@@ -8,9 +8,11 @@ Run standalone: python examples/agents/basic-agent.py
 Or discover via: picoagentsui --dir examples/agents
 """
 
-import asyncio
+import ast
+import operator
+from functools import lru_cache
 
-from picoagents import Agent, OpenAIChatCompletionClient
+from picoagents import Agent, OpenAIChatCompletionClient, print_stream, run
 
 
 def get_weather(location: str) -> str:
@@ -18,10 +20,44 @@ def get_weather(location: str) -> str:
     return f"The weather in {location} is sunny, 75°F"
 
 
+# Arithmetic the calculator accepts; anything else in the expression is rejected
+_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+def _eval(node: ast.expr) -> float:
+    """Evaluate a parsed arithmetic expression, refusing names, calls and attributes."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPS:
+        left, right = _eval(node.left), _eval(node.right)
+        if isinstance(node.op, ast.Pow) and abs(right) > 100:
+            raise ValueError("exponent too large")
+        return _OPS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _OPS:
+        return _OPS[type(node.op)](_eval(node.operand))
+    raise ValueError(f"unsupported syntax: {type(node).__name__}")
+
+
+@lru_cache(maxsize=256)
+def _evaluate(expression: str) -> float:
+    """Parse and evaluate an expression once; repeated expressions hit the cache."""
+    return _eval(ast.parse(expression, mode="eval").body)
+
+
 def calculate(expression: str) -> str:
     """Perform basic mathematical calculations."""
     try:
-        result = eval(expression)
+        result = _evaluate(expression)
         return f"The result of {expression} is {result}"
     except Exception as e:
         return f"Error calculating {expression}: {e}"
@@ -49,11 +85,12 @@ async def main():
     print(f"Agent: {agent.name}")
     print(f"Tools: {[tool.name for tool in agent.tools]}\n")
 
-    async for event in agent.run_stream(
-        "What's the weather in New York and what is 12 * 15?", stream_tokens=False
-    ):
-        print(event)
+    await print_stream(
+        agent.run_stream(
+            "What's the weather in New York and what is 12 * 15?", stream_tokens=False
+        )
+    )
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
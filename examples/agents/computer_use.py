@@ -11,6 +11,7 @@ with specialized Playwright tools for web automation.
 import asyncio
 import os
 
+from picoagents import print_stream
 from picoagents.agents import ComputerUseAgent, PlaywrightWebClient
 from picoagents.llm import AzureOpenAIChatCompletionClient, OpenAIChatCompletionClient
 
@@ -56,8 +57,7 @@ async def basic_example():
 
         try:
             # 4. Stream execution with real-time updates
-            async for event in computer_agent.run_stream(task):
-                print(event)
+            await print_stream(computer_agent.run_stream(task))
 
         except Exception as e:
             print(f"❌ Error: {type(e).__name__}: {e}")
@@ -3,10 +3,10 @@ Super minimal examples of ListMemory and ChromaDBMemory usage.
 Shows how memory affects agent behavior and semantic search capabilities.
 """
 
-import asyncio
 import os
+from functools import cache
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import AzureOpenAIChatCompletionClient
 from picoagents.memory import ListMemory, MemoryContent
 
@@ -20,18 +20,24 @@ except ImportError:
     print("ChromaDB not available. Install with: pip install 'picoagents[rag]'")
 
 
+@cache
+def get_model_client() -> AzureOpenAIChatCompletionClient:
+    """Create the Azure client once; both examples share it and its connection pool."""
+    return AzureOpenAIChatCompletionClient(
+        azure_deployment="gpt-4.1-mini",
+        azure_endpoint=os.environ.get(
+            "AZURE_OPENAI_ENDPOINT", "https://your-endpoint.openai.azure.com/"
+        ),
+    )
+
+
 async def list_memory_example():
     """Minimal ListMemory example."""
     print("=== LIST MEMORY EXAMPLE ===")
 
     # Create Azure client
     try:
-        model_client = AzureOpenAIChatCompletionClient(
-            azure_deployment="gpt-4.1-mini",
-            azure_endpoint=os.environ.get(
-                "AZURE_OPENAI_ENDPOINT", "https://your-endpoint.openai.azure.com/"
-            ),
-        )
+        model_client = get_model_client()
     except Exception as e:
         print(f"Azure client setup failed: {e}")
         print("Make sure AZURE_OPENAI_ENDPOINT environment variable is set")
@@ -69,12 +75,7 @@ async def chromadb_example():
 
     # Create Azure client
     try:
-        model_client = AzureOpenAIChatCompletionClient(
-            azure_deployment="gpt-4.1-mini",
-            azure_endpoint=os.environ.get(
-                "AZURE_OPENAI_ENDPOINT", "https://your-endpoint.openai.azure.com/"
-            ),
-        )
+        model_client = get_model_client()
     except Exception as e:
         print(f"Azure client setup failed: {e}")
         print("Make sure AZURE_OPENAI_ENDPOINT environment variable is set")
@@ -94,8 +95,8 @@ async def chromadb_example():
         "The office has a coffee machine on the 3rd floor",
     ]
 
-    for fact in facts:
-        await memory.add(MemoryContent(content=fact))
+    # One insert, so all facts are embedded in a single batch
+    await memory.add_many([MemoryContent(content=fact) for fact in facts])
 
     # Test semantic search - query about "programming" should find Bob
     query_result = await memory.query("programming languages", limit=2)
@@ -125,4 +126,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -3,7 +3,6 @@ Examples from Chapter 4: Building Agents from Scratch
 Demonstrates the three middleware examples from the book.
 """
 
-import asyncio
 import os
 import re
 
@@ -13,6 +12,7 @@ from picoagents import (
     LoggingMiddleware,
     PIIRedactionMiddleware,
     RateLimitMiddleware,
+    run,
 )
 from picoagents.llm import AzureOpenAIChatCompletionClient
 
@@ -217,4 +217,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
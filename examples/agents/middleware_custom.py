@@ -15,14 +15,13 @@ Key concepts covered:
 - Composable middleware architecture
 """
 
-import asyncio
 import logging
 import os
 import re
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from picoagents import BaseMiddleware, MiddlewareContext
+from picoagents import BaseMiddleware, MiddlewareContext, run
 from picoagents.agents import Agent
 from picoagents.context import AgentContext
 from picoagents.llm import AzureOpenAIChatCompletionClient
@@ -727,4 +726,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
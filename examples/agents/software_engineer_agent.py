@@ -19,7 +19,7 @@ import asyncio
 import os
 from pathlib import Path
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import AzureOpenAIChatCompletionClient
 from picoagents.tools import (
     MemoryTool,
@@ -275,19 +275,27 @@ Check your memory for any documentation patterns or conventions.
     print("=" * 70)
     print(f"\nWorkspace: {workspace.absolute()}")
     print(f"Agent Memory: {memory_path.absolute()}")
+    # List both trees in worker threads so a large workspace doesn't block the loop;
+    # os.walk reads each directory with scandir, so there is no extra stat per entry
+    files, memory_files = await asyncio.gather(
+        asyncio.to_thread(
+            lambda: [Path(d, n) for d, _, names in os.walk(workspace) for n in names]
+        ),
+        asyncio.to_thread(
+            lambda: [Path(d, n) for d, _, names in os.walk(memory_path) for n in names]
+        ),
+    )
     print("\nGenerated files:")
-    for file in workspace.rglob("*"):
-        if file.is_file():
-            print(f"  - {file.relative_to(workspace)}")
+    for file in files:
+        print(f"  - {file.relative_to(workspace)}")
 
     print("\nMemory files:")
-    for file in memory_path.rglob("*"):
-        if file.is_file():
-            print(f"  - {file.relative_to(memory_path)}")
+    for file in memory_files:
+        print(f"  - {file.relative_to(memory_path)}")
 
     print("\nThe agent has built up memory that will persist for future runs!")
     print("Try running the script again with a different task to see memory in action.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -5,11 +5,11 @@ This example demonstrates how to call a model with structured output
 using Pydantic models to ensure type-safe responses.
 """
 
-import asyncio
 from typing import List, cast
 
 from pydantic import BaseModel, Field
 
+from picoagents import run
 from picoagents.llm import OpenAIChatCompletionClient
 from picoagents.messages import Message, UserMessage
 
@@ -53,4 +53,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
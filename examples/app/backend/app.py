@@ -18,22 +18,28 @@ Then open: http://localhost:8000
 """
 
 import asyncio
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional, Tuple
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from picoagents import Agent, CancellationToken, OpenAIChatCompletionClient
+from picoagents import Agent, CancellationToken, OpenAIChatCompletionClient, tool
+from picoagents.types import ModelStreamChunkEvent
 
 
 # ============================================================================
 # Layer 1: Agent Execution
 # ============================================================================
 
+# A real weather lookup is a blocking HTTP call, so it runs in a worker thread
+# and doesn't stall the SSE stream or other tool calls
+@tool(run_in_thread=True)
 def get_weather(location: str) -> str:
     """Get weather for a location."""
     return f"Weather in {location}: Sunny, 72°F"
@@ -53,7 +59,14 @@ weather_agent = Agent(
 # Layer 2: Communication Bridge (FastAPI + SSE)
 # ============================================================================
 
-app = FastAPI(title="Minimal Agent Web App")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Mount the frontend (Layer 3) when the server starts, not when the module is imported."""
+    mount_frontend(app)
+    yield
+
+
+app = FastAPI(title="Minimal Agent Web App", lifespan=lifespan)
 
 # Enable CORS for local development
 app.add_middleware(
@@ -65,36 +78,125 @@ app.add_middleware(
 )
 
 
+@lru_cache(maxsize=None)
+def event_adapter(event_type: type) -> TypeAdapter:
+    """One TypeAdapter per event class, built on first use and reused for every event."""
+    return TypeAdapter(event_type)
+
+
+# SSE frame delimiters
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
+# Token frames arriving within this window are sent to the client in one write
+SSE_FLUSH_WINDOW = 0.005  # seconds
+SSE_MAX_BATCH_BYTES = 4096
+# Frames the agent may produce ahead of a slow client
+SSE_PREFETCH = 32
+
+
 class ChatRequest(BaseModel):
     """User message request."""
 
     message: str
 
 
+async def produce_frames(
+    message: str,
+    cancellation_token: CancellationToken,
+    queue: "asyncio.Queue[Optional[Tuple[bytes, bool]]]",
+) -> None:
+    """
+    Run the agent and queue each event as an encoded SSE frame.
+
+    Runs as its own task so the agent keeps generating while earlier frames are
+    still being written to the client. Each item is (frame, is_token_chunk); None
+    marks the end of the stream.
+    """
+    try:
+        # Stream events from the agent, passing the cancellation token
+        async for event in weather_agent.run_stream(
+            message, stream_tokens=True, cancellation_token=cancellation_token
+        ):
+            # Format as Server-Sent Event
+            # The "data: " prefix is required by the SSE protocol. dump_json returns
+            # bytes, so the event is never decoded to str and re-encoded for the wire,
+            # and join builds the frame in one allocation.
+            frame = b"".join(
+                (SSE_PREFIX, event_adapter(type(event)).dump_json(event), SSE_SUFFIX)
+            )
+            await queue.put((frame, isinstance(event, ModelStreamChunkEvent)))
+    except asyncio.CancelledError:
+        # The client is gone: nothing reads the end marker any more, and the queue
+        # may be full, so waiting to put it would never finish
+        raise
+    except Exception:
+        await queue.put(None)
+        raise
+    else:
+        await queue.put(None)
+
+
 async def stream_agent_events(
     message: str, cancellation_token: CancellationToken
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Stream agent execution events as Server-Sent Events with cancellation support.
 
     This is the key bridge between agent execution and the UI.
     It converts agent events into SSE format that browsers can consume.
     The cancellation_token allows graceful interruption of long-running tasks.
+    The agent runs ahead in a producer task, up to SSE_PREFETCH frames, and token
+    chunks that arrive close together are coalesced into one write of several
+    SSE frames; every other event flushes immediately.
     """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Optional[Tuple[bytes, bool]]] = asyncio.Queue(
+        maxsize=SSE_PREFETCH
+    )
+    producer = asyncio.create_task(produce_frames(message, cancellation_token, queue))
+    batch = bytearray()
+    deadline = 0.0
     try:
-        # Stream events from the agent, passing the cancellation token
-        async for event in weather_agent.run_stream(
-            message, stream_tokens=True, cancellation_token=cancellation_token
-        ):
-            # Format as Server-Sent Event
-            # The "data: " prefix is required by the SSE protocol
-            yield f"data: {event.model_dump_json()}\n\n"
+        while True:
+            if batch:
+                # Send what we have if the next frame doesn't arrive within the window
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), max(0.0, deadline - loop.time())
+                    )
+                except asyncio.TimeoutError:
+                    yield bytes(batch)
+                    batch.clear()
+                    continue
+            else:
+                item = await queue.get()
+            if item is None:
+                break
+
+            frame, is_token_chunk = item
+            if not batch:
+                deadline = loop.time() + SSE_FLUSH_WINDOW
+            batch += frame
+            if not is_token_chunk or len(batch) >= SSE_MAX_BATCH_BYTES:
+                yield bytes(batch)
+                batch.clear()
+
+        if batch:
+            yield bytes(batch)
+        # Surface any error raised by the agent
+        await producer
 
     except (GeneratorExit, asyncio.CancelledError):
         # Client disconnected (e.g., clicked Stop button)
         # Trigger cancellation to stop agent execution and save resources
         cancellation_token.cancel()
         raise
+    finally:
+        if not producer.done():
+            producer.cancel()
+            with suppress(asyncio.CancelledError):
+                await producer
 
 
 @app.post("/chat/stream")
@@ -132,14 +234,22 @@ async def health():
 # Layer 3: Serve Frontend
 # ============================================================================
 
-# Mount the frontend directory to serve static files
-# In production, you'd use a CDN or separate static file server
-import os
-from pathlib import Path
-
 frontend_dir = Path(__file__).parent.parent / "frontend"
-if frontend_dir.exists():
-    app.mount("/", StaticFiles(directory=str(frontend_dir), html=True), name="frontend")
+
+
+def mount_frontend(app: FastAPI) -> None:
+    """
+    Mount the frontend directory to serve static files.
+
+    Called from the lifespan handler, so the directory check runs once at startup.
+    In production, you'd use a CDN or separate static file server.
+    """
+    if frontend_dir.exists():
+        app.mount(
+            "/",
+            StaticFiles(directory=str(frontend_dir), html=True, check_dir=False),
+            name="frontend",
+        )
 
 
 if __name__ == "__main__":
@@ -6,17 +6,17 @@ Demonstrates baseline, compaction, and isolation strategies in a single file.
 Run with: python context_strategies.py
 """
 
-import asyncio
 import json
 import os
 import sys
+from functools import cache
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "picoagents"))
 
 import matplotlib.pyplot as plt
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents._middleware import BaseMiddleware, MiddlewareContext
 from picoagents.llm import AzureOpenAIChatCompletionClient
 from picoagents.messages import Message
@@ -33,6 +33,16 @@ from mock_tools import (
 from token_tracking import TokenTrackingMiddleware
 
 
+@cache
+def get_model_client() -> AzureOpenAIChatCompletionClient:
+    """Create the Azure client once; every agent in every strategy shares its connection pool."""
+    return AzureOpenAIChatCompletionClient(
+        model="gpt-4.1-mini",
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+    )
+
+
 # =============================================================================
 # MIDDLEWARE: Context Compaction
 # =============================================================================
@@ -44,6 +54,14 @@ class ContextCompactionMiddleware(BaseMiddleware):
     def __init__(self, keep_last_turns: int = 5):
         super().__init__()
         self.keep_last_turns = keep_last_turns
+        # The agent appends to the same message list on every model call, so the
+        # system/conversation split of the last list seen is extended, not rebuilt.
+        # Holding the list itself (lists can't be weakly referenced) keeps its id
+        # from being reused by a different list.
+        self._seen: Optional[List[Message]] = None
+        self._seen_len = 0
+        self._system_messages: List[Message] = []
+        self._conversation: List[Message] = []
 
     async def process_request(self, context: MiddlewareContext) -> AsyncGenerator[Any, None]:
         if context.operation == "model_call" and isinstance(context.data, list):
@@ -53,10 +71,16 @@ class ContextCompactionMiddleware(BaseMiddleware):
     def _compact_messages(self, messages: List[Message]) -> List[Message]:
         if len(messages) <= (self.keep_last_turns * 2 + 2):
             return messages
-        system_messages = [m for m in messages if m.role == "system"]
-        conversation = [m for m in messages if m.role != "system"]
-        recent_conversation = conversation[-(self.keep_last_turns * 2) :]
-        return system_messages + recent_conversation
+        if messages is not self._seen or len(messages) < self._seen_len:
+            self._seen, self._seen_len = messages, 0
+            self._system_messages, self._conversation = [], []
+        # One pass over the new messages, appending each to its side of the split
+        system_messages, conversation = self._system_messages, self._conversation
+        for m in messages[self._seen_len :]:
+            (system_messages if m.role == "system" else conversation).append(m)
+        self._seen_len = len(messages)
+        recent_conversation = self._conversation[-(self.keep_last_turns * 2) :]
+        return self._system_messages + recent_conversation
 
     async def process_response(self, context: MiddlewareContext, result: Any) -> AsyncGenerator[Any, None]:
         yield result
@@ -82,11 +106,7 @@ async def run_baseline() -> TokenTrackingMiddleware:
         name="researcher",
         description="Research AI/ML companies without context management",
         instructions="Research companies thoroughly. For each company, gather: details, funding, metrics.",
-        model_client=AzureOpenAIChatCompletionClient(
-            model="gpt-4.1-mini",
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        ),
+        model_client=get_model_client(),
         max_iterations=30,
         tools=[
             search_companies_tool,
@@ -127,11 +147,7 @@ async def run_compaction() -> TokenTrackingMiddleware:
         name="researcher",
         description="Research AI/ML companies with context compaction",
         instructions="Research companies thoroughly. For each company, gather: details, funding, metrics.",
-        model_client=AzureOpenAIChatCompletionClient(
-            model="gpt-4.1-mini",
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        ),
+        model_client=get_model_client(),
         max_iterations=30,
         tools=[
             search_companies_tool,
@@ -171,11 +187,7 @@ async def run_isolation() -> TokenTrackingMiddleware:
         name="specialist",
         description="Research specialist with isolated context",
         instructions="Execute research tasks and return findings.",
-        model_client=AzureOpenAIChatCompletionClient(
-            model="gpt-4.1-mini",
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        ),
+        model_client=get_model_client(),
         max_iterations=15,
         tools=[
             search_companies_tool,
@@ -200,11 +212,7 @@ async def run_isolation() -> TokenTrackingMiddleware:
         name="coordinator",
         description="Research coordinator with isolated context",
         instructions="Coordinate research using specialist agent. Synthesize findings into report.",
-        model_client=AzureOpenAIChatCompletionClient(
-            model="gpt-4.1-mini",
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-        ),
+        model_client=get_model_client(),
         max_iterations=5,
         tools=[research_tool, report_tool],
         middlewares=[coordinator_tracker],
@@ -424,4 +432,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
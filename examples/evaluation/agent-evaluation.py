@@ -3,14 +3,13 @@
 Comprehensive evaluation comparing direct models, agents, and multi-agent systems. 
 """
 
-import asyncio
 import os
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import pandas as pd
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.eval import (
     AgentEvalTarget,
     EvalRunner,
@@ -322,4 +321,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -28,7 +28,6 @@ Focus: Generate clear insights about when/why multi-agent systems matter.
 """
 
 import argparse
-import asyncio
 import os
 from pathlib import Path
 from typing import Any, Dict, List
@@ -37,7 +36,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.eval import (
     AgentEvalTarget,
     CompositeJudge,
@@ -906,4 +905,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
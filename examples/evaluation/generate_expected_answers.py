@@ -6,12 +6,11 @@ This script uses the AI-driven research team to answer complex questions,
 then we can use those answers as expected outputs in the evaluation suite.
 """
 
-import asyncio
 import json
 import os
 from pathlib import Path
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import AzureOpenAIChatCompletionClient
 from picoagents.orchestration import AIOrchestrator
 from picoagents.termination import MaxMessageTermination, TextMentionTermination
@@ -218,4 +217,4 @@ if __name__ == "__main__":
     print("   - GOOGLE_API_KEY and GOOGLE_CSE_ID (for web search)")
     print("   - This will make multiple API calls and may take 5-10 minutes\n")
 
-    asyncio.run(main())
+    run(main())
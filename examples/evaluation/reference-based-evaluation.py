@@ -9,11 +9,10 @@ Compares:
 3. CompositeJudge combining multiple evaluation approaches
 """
 
-import asyncio
 import os
 from pathlib import Path
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.eval import (
     AgentEvalTarget,
     CompositeJudge,
@@ -342,4 +341,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -31,12 +31,11 @@ Usage:
     python examples/mcp/basic_mcp_agent.py ~/Documents
 """
 
-import asyncio
 import os
 import sys
 from pathlib import Path
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import AzureOpenAIChatCompletionClient, OpenAIChatCompletionClient
 from picoagents.tools import ApprovalMode, MCP_AVAILABLE, StdioServerConfig, create_mcp_tools
 
@@ -188,4 +187,4 @@ Be clear and concise in your responses.""",
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -12,10 +12,9 @@ The team uses AI-driven orchestration to intelligently coordinate between
 specialized agents based on the research task requirements.
 """
 
-import asyncio
 import os
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import AzureOpenAIChatCompletionClient
 from picoagents.orchestration import AIOrchestrator
 from picoagents.termination import MaxMessageTermination, TextMentionTermination
@@ -205,4 +204,4 @@ if __name__ == "__main__":
     print("   - GOOGLE_API_KEY and GOOGLE_CSE_ID (for web search)")
     print("   - Install: pip install 'picoagents[all]'\n")
 
-    asyncio.run(main())
+    run(main())
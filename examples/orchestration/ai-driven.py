@@ -6,9 +6,7 @@ This example demonstrates intelligent agent selection where an LLM
 chooses which agent should respond next based on conversation context.
 """
 
-import asyncio
-
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import OpenAIChatCompletionClient
 from picoagents.orchestration import AIOrchestrator
 from picoagents.termination import MaxMessageTermination, TextMentionTermination
@@ -90,4 +88,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -6,9 +6,7 @@ This example demonstrates how the orchestrator creates an execution plan
 with agent assignments and tracks step progress with retry logic.
 """
 
-import asyncio
-
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import OpenAIChatCompletionClient
 from picoagents.orchestration import PlanBasedOrchestrator
 from picoagents.termination import MaxMessageTermination, TextMentionTermination
@@ -105,4 +103,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
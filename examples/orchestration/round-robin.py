@@ -10,9 +10,7 @@ Run with Web UI:
 """
 
 import argparse
-import asyncio
-
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import OpenAIChatCompletionClient
 from picoagents.orchestration import RoundRobinOrchestrator
 from picoagents.termination import MaxMessageTermination, TextMentionTermination
@@ -98,4 +96,4 @@ if __name__ == "__main__":
         )
     else:
         # Run in CLI mode
-        asyncio.run(main())
+        run(main())
@@ -16,7 +16,7 @@ os.environ["OTEL_SERVICE_NAME"] = "picoagents-debug"
 # OPT-IN: Capture prompts, completions, tool parameters and results
 os.environ["PICOAGENTS_OTEL_CAPTURE_CONTENT"] = "true"
 
-from picoagents import Agent  # noqa: E402
+from picoagents import Agent, run  # noqa: E402
 from picoagents.llm import OpenAIChatCompletionClient  # noqa: E402
 from picoagents.tools import FunctionTool  # noqa: E402
 
@@ -60,6 +60,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-
-    asyncio.run(main())
+    run(main())
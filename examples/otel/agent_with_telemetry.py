@@ -29,7 +29,7 @@ os.environ["OTEL_SERVICE_NAME"] = "picoagents-example"
 # WARNING: May contain sensitive information - disabled by default
 os.environ["PICOAGENTS_OTEL_CAPTURE_CONTENT"] = "true"
 
-from picoagents import Agent  # noqa: E402
+from picoagents import Agent, run  # noqa: E402
 from picoagents.llm import OpenAIChatCompletionClient  # noqa: E402
 from picoagents.tools import FunctionTool  # noqa: E402
 
@@ -95,6 +95,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-
-    asyncio.run(main())
+    run(main())
@@ -7,10 +7,9 @@ This example shows how to:
 3. Continue execution after approval/rejection
 """
 
-import asyncio 
 from typing import List
 import os
-from picoagents import Agent, AgentContext
+from picoagents import Agent, AgentContext, run
 from picoagents.llm import AzureOpenAIChatCompletionClient
 from picoagents.tools import ApprovalMode, tool
 
@@ -297,4 +296,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
@@ -11,12 +11,11 @@ This example shows:
 Run with: python examples/tools/basic.py
 """
 
-import asyncio
 import os
 import tempfile
 from pathlib import Path
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import AzureOpenAIChatCompletionClient
 from picoagents.tools import (
     RESEARCH_TOOLS_AVAILABLE,
@@ -238,4 +237,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -24,10 +24,9 @@ If you encounter failures, try:
 Run with: python examples/tools/youtube_caption_demo.py
 """
 
-import asyncio
 import os
 
-from picoagents import Agent
+from picoagents import Agent, run
 from picoagents.llm import AzureOpenAIChatCompletionClient
 from picoagents.tools import YouTubeCaptionTool
 
@@ -152,4 +151,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
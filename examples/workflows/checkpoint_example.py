@@ -13,6 +13,7 @@ import asyncio
 from pathlib import Path
 from pydantic import BaseModel
 
+from picoagents import run
 from picoagents.workflow import (
     Workflow,
     WorkflowRunner,
@@ -302,4 +303,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -11,11 +11,11 @@ Usage: python workflow.py
 Requires: AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_API_KEY environment variables
 """
 
-import asyncio
 import os
 import time
 from pathlib import Path
 
+from picoagents import run
 from picoagents.workflow import (
     FunctionStep,
     StepMetadata,
@@ -182,4 +182,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -5,10 +5,9 @@ Demonstrates the new fluent API for building workflows with
 improved readability and reduced boilerplate.
 """
 
-import asyncio
-
 from pydantic import BaseModel
 
+from picoagents import run
 from picoagents.workflow import FunctionStep, Workflow, WorkflowRunner
 from picoagents.workflow.core import Context, StepMetadata, WorkflowMetadata
 
@@ -125,4 +124,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
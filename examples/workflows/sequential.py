@@ -7,6 +7,7 @@ from typing import Any, Dict
 
 from pydantic import BaseModel
 
+from picoagents import run
 from picoagents.workflow import (
     Context,
     FunctionStep,
@@ -205,4 +206,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
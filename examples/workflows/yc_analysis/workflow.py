@@ -19,12 +19,12 @@ Outputs:
 """
 
 import argparse
-import asyncio
 import os
 import sys
 import time
 from pathlib import Path
 
+from picoagents import run
 from picoagents.workflow import (
     FunctionStep,
     StepMetadata,
@@ -163,4 +163,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
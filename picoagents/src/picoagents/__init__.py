@@ -19,6 +19,9 @@ if os.getenv("PICOAGENTS_ENABLE_OTEL", "false").lower() in ("true", "1", "yes"):
 # Cancellation support
 from ._cancellation_token import CancellationToken
 
+# Shared event loop for entrypoints
+from ._runtime import print_stream, run
+
 # Component configuration system
 from ._component_config import (
     Component,
@@ -169,6 +172,9 @@ __all__ = [
     "OrchestrationEvent",
     # Cancellation
     "CancellationToken",
+    # Runtime
+    "run",
+    "print_stream",
     # Component Configuration
     "ComponentModel",
     "ComponentFromConfig",
@@ -0,0 +1,152 @@
+"""
+Shared event loop for running picoagents entrypoints.
+
+``asyncio.run`` creates and closes a fresh event loop on every call. Scripts and
+REPL sessions that call ``main()`` repeatedly pay that setup each time, and any
+loop-bound resources (HTTP connection pools, clients) are lost between calls.
+``run`` keeps one loop alive for the life of the process instead.
+
+If uvloop is installed (``pip install picoagents[uvloop]``), the shared loop is a
+uvloop loop. Only loops created by ``run`` are affected; the global event loop
+policy is left alone.
+
+``print_stream`` is the matching helper for printing an agent's event stream from
+such an entrypoint.
+"""
+
+import asyncio
+import atexit
+import contextlib
+import sys
+from typing import Any, AsyncIterator, Callable, Coroutine, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+try:
+    import uvloop
+
+    _new_event_loop: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+if sys.version_info >= (3, 11):
+    _runner: Optional[asyncio.Runner] = None
+
+    def _get_loop_runner() -> asyncio.Runner:
+        global _runner
+        if _runner is None:
+            _runner = asyncio.Runner(loop_factory=_new_event_loop)
+            atexit.register(_runner.close)
+        return _runner
+
+    def run(main: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the shared picoagents event loop.
+
+        Drop-in replacement for ``asyncio.run`` that reuses the same loop across
+        calls.
+
+        Args:
+            main: Coroutine to run to completion
+
+        Returns:
+            The coroutine's result
+        """
+        return _get_loop_runner().run(main)
+
+else:
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_loop() -> asyncio.AbstractEventLoop:
+        global _loop
+        if _loop is None or _loop.is_closed():
+            _loop = _new_event_loop()
+            atexit.register(_loop.close)
+        return _loop
+
+    def run(main: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the shared picoagents event loop.
+
+        Drop-in replacement for ``asyncio.run`` that reuses the same loop across
+        calls.
+
+        Args:
+            main: Coroutine to run to completion
+
+        Returns:
+            The coroutine's result
+        """
+        loop = _get_loop()
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+
+
+_STREAM_END = object()
+
+
+async def print_stream(
+    stream: AsyncIterator[Any], flush_interval: float = 0.016, maxsize: int = 32
+) -> None:
+    """
+    Print each item of an async stream (e.g. ``agent.run_stream(...)``) on its own line.
+
+    A background task reads the stream into a bounded queue, so the stream keeps
+    being consumed while output is written. Lines are collected and written to
+    stdout at most once per ``flush_interval`` (about one frame) instead of once
+    per item. Any error raised by the stream is re-raised here.
+
+    Args:
+        stream: Async iterator of events to print
+        flush_interval: Seconds to collect lines before writing them out
+        maxsize: Items the reader may get ahead of the printer
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+
+    async def produce() -> None:
+        try:
+            async for item in stream:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+
+    producer = asyncio.create_task(produce())
+    loop = asyncio.get_running_loop()
+    pending: List[str] = []
+    deadline = 0.0
+    # One get() at a time, awaited with asyncio.wait: unlike wait_for, it never
+    # swallows a cancellation that races with an item arriving
+    getter: Optional["asyncio.Task[Any]"] = None
+    try:
+        while True:
+            if getter is None:
+                getter = asyncio.ensure_future(queue.get())
+            timeout = max(0.0, deadline - loop.time()) if pending else None
+            done, _ = await asyncio.wait({getter}, timeout=timeout)
+            if not done:
+                item = None
+            else:
+                item, getter = getter.result(), None
+                if item is not _STREAM_END and not isinstance(item, Exception):
+                    if not pending:
+                        deadline = loop.time() + flush_interval
+                    pending.append(f"{item}\n")
+                    if loop.time() < deadline:
+                        continue
+            if pending:
+                sys.stdout.write("".join(pending))
+                sys.stdout.flush()
+                pending.clear()
+            if isinstance(item, Exception):
+                raise item
+            if item is _STREAM_END:
+                break
+    finally:
+        if getter is not None:
+            getter.cancel()
+        if not producer.done():
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
@@ -9,7 +9,7 @@ import asyncio
 import os
 import time
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
@@ -17,6 +17,7 @@ from pydantic import BaseModel, Field
 from .._cancellation_token import CancellationToken
 from .._component_config import Component, ComponentModel
 from ..context import AgentContext
+from ..llm._base import batch_stream_chunks
 from ..messages import (
     AssistantMessage,
     Message,
@@ -58,6 +59,7 @@ class AgentConfig(BaseModel):
     summarize_tool_result: bool = (
         True  # If False, stop after tool execution without LLM summarization
     )
+    max_parallel_tools: Optional[int] = None  # Cap on concurrent tool calls per turn
 
 
 class Agent(Component[AgentConfig], BaseAgent):
@@ -262,16 +264,25 @@ class Agent(Component[AgentConfig], BaseAgent):
                         # Pass empty list since context messages are added inside _prepare_llm_messages
                         llm_messages_temp = await self._prepare_llm_messages([])
 
-                        # Process each tool call
-                        for tool_call in last_message.tool_calls:
-                            async for item in self._execute_tool_call(
-                                tool_call, llm_messages_temp, cancellation_token
+                        # Process the pending tool calls, in parallel when there are several
+                        if len(last_message.tool_calls) > 1:
+                            pending_items = self._execute_tool_calls_parallel(
+                                last_message.tool_calls,
+                                llm_messages_temp,
+                                cancellation_token,
+                            )
+                        else:
+                            pending_items = self._execute_tool_call(
+                                last_message.tool_calls[0],
+                                llm_messages_temp,
+                                cancellation_token,
+                            )
+                        async for item in pending_items:
+                            yield item
+                            if isinstance(
+                                item, (UserMessage, AssistantMessage, ToolMessage)
                             ):
-                                yield item
-                                if isinstance(
-                                    item, (UserMessage, AssistantMessage, ToolMessage)
-                                ):
-                                    messages_yielded.append(item)
+                                messages_yielded.append(item)
 
             # 2. Prepare messages for LLM including system instructions, memory, history
             # Pass empty list since context messages are added inside _prepare_llm_messages
@@ -303,7 +314,7 @@ class Agent(Component[AgentConfig], BaseAgent):
 
                     if effective_stream_tokens:
                         # STREAMING PATH: Stream tokens and accumulate result
-                        accumulated_content = ""
+                        content_parts: List[str] = []  # Joined once the stream ends
                         accumulated_tool_calls = {}  # Dict by call_id for final state
                         last_call_id = (
                             None  # Track last seen call_id for chunks without ID
@@ -311,8 +322,12 @@ class Agent(Component[AgentConfig], BaseAgent):
                         structured_output = None
                         streaming_usage = None  # Track usage from final chunk
 
-                        async for chunk in self.model_client.create_stream(
-                            llm_messages, tools=tools, output_format=self.output_format
+                        async for chunk in batch_stream_chunks(
+                            self.model_client.create_stream(
+                                llm_messages,
+                                tools=tools,
+                                output_format=self.output_format,
+                            )
                         ):
                             # Check for cancellation during streaming
                             if cancellation_token and cancellation_token.is_cancelled():
@@ -324,7 +339,7 @@ class Agent(Component[AgentConfig], BaseAgent):
 
                                 # Accumulate content
                                 if chunk.content:
-                                    accumulated_content += chunk.content
+                                    content_parts.append(chunk.content)
 
                                 # Store tool call data (each chunk has complete state)
                                 if chunk.tool_call_chunk:
@@ -390,7 +405,7 @@ class Agent(Component[AgentConfig], BaseAgent):
                         from ..types import ChatCompletionResult
 
                         accumulated_message = AssistantMessage(
-                            content=accumulated_content,
+                            content="".join(content_parts),
                             source="llm",
                             tool_calls=tool_calls if tool_calls else None,
                         )
@@ -712,6 +727,7 @@ class Agent(Component[AgentConfig], BaseAgent):
 
         This method uses asyncio.gather to execute independent tool calls concurrently,
         following Anthropic's best practice of parallel tool execution for Claude 4 models.
+        When max_parallel_tools is set, at most that many calls run at once.
 
         Args:
             tool_calls: List of tool calls to execute in parallel
@@ -725,14 +741,22 @@ class Agent(Component[AgentConfig], BaseAgent):
         if cancellation_token and cancellation_token.is_cancelled():
             raise asyncio.CancelledError()
 
+        # Limit concurrency for this batch (e.g. several agent-as-tool calls hitting one API)
+        limit = (
+            asyncio.Semaphore(self.max_parallel_tools)
+            if self.max_parallel_tools
+            else nullcontext()
+        )
+
         # Collect all items from parallel execution
         async def collect_tool_results(tool_call):
             """Helper to collect all items from a single tool execution."""
             items = []
-            async for item in self._execute_tool_call(
-                tool_call, llm_messages, cancellation_token
-            ):
-                items.append(item)
+            async with limit:
+                async for item in self._execute_tool_call(
+                    tool_call, llm_messages, cancellation_token
+                ):
+                    items.append(item)
             return items
 
         try:
@@ -1067,6 +1091,7 @@ class Agent(Component[AgentConfig], BaseAgent):
             max_iterations=self.max_iterations,
             output_format_schema=output_format_schema,
             summarize_tool_result=self.summarize_tool_result,
+            max_parallel_tools=self.max_parallel_tools,
         )
 
     @classmethod
@@ -1132,4 +1157,5 @@ class Agent(Component[AgentConfig], BaseAgent):
             max_iterations=config.max_iterations,
             output_format=output_format,
             summarize_tool_result=config.summarize_tool_result,
+            max_parallel_tools=config.max_parallel_tools,
         )
@@ -39,7 +39,7 @@ class BaseAgent(ComponentBase[BaseModel], ABC):
         name: str,
         description: str,
         instructions: str,
-        model_client: BaseChatCompletionClient,
+        model_client: Optional[BaseChatCompletionClient] = None,
         tools: Optional[List[Union[BaseTool, Callable]]] = None,
         memory: Optional[BaseMemory] = None,
         context: Optional[AgentContext] = None,
@@ -49,6 +49,8 @@ class BaseAgent(ComponentBase[BaseModel], ABC):
         summarize_tool_result: bool = True,
         required_tools: Optional[List[str]] = None,
         example_tasks: Optional[List[str]] = None,
+        max_parallel_tools: Optional[int] = None,
+        model_client_factory: Optional[Callable[[], BaseChatCompletionClient]] = None,
         **kwargs: Any,
     ):
         """
@@ -58,7 +60,7 @@ class BaseAgent(ComponentBase[BaseModel], ABC):
             name: Unique identifier for the agent
             description: External-facing description for orchestrators/other agents
             instructions: Internal system prompt/role definition for LLM calls
-            model_client: Abstraction for LLM API calls
+            model_client: Abstraction for LLM API calls (or pass model_client_factory instead)
             tools: Available tools for the agent
             memory: Persistent storage for agent state
             context: Agent context containing messages and metadata
@@ -68,12 +70,15 @@ class BaseAgent(ComponentBase[BaseModel], ABC):
             summarize_tool_result: If False, agent stops after tool execution without LLM summarization
             required_tools: Optional list of tool names that MUST be used (forced tool use)
             example_tasks: Optional list of example tasks to help users discover agent capabilities
+            max_parallel_tools: Optional cap on tool calls from one LLM turn that run at the same time (None = no cap)
+            model_client_factory: Optional zero-argument callable that builds the model client on first use
             **kwargs: Additional configuration
         """
         self.name = name
         self.description = description
         self.instructions = instructions
-        self.model_client = model_client
+        self._model_client = model_client
+        self._model_client_factory = model_client_factory
         self.tools: List[BaseTool] = self._process_tools(tools or [])
         self.memory = memory
         self.context = context or AgentContext()
@@ -83,6 +88,7 @@ class BaseAgent(ComponentBase[BaseModel], ABC):
         self.summarize_tool_result = summarize_tool_result
         self.required_tools = required_tools or []
         self.example_tasks = example_tasks or []
+        self.max_parallel_tools = max_parallel_tools
 
         # Validate configuration
         self._validate_configuration()
@@ -98,9 +104,30 @@ class BaseAgent(ComponentBase[BaseModel], ABC):
         if not self.instructions:
             raise AgentConfigurationError("Agent instructions cannot be empty")
 
-        if self.model_client is None:
+        if self._model_client is None and self._model_client_factory is None:
             raise AgentConfigurationError("Model client is required")
 
+        if self.max_parallel_tools is not None and self.max_parallel_tools < 1:
+            raise AgentConfigurationError("max_parallel_tools must be at least 1")
+
+    @property
+    def model_client(self) -> BaseChatCompletionClient:
+        """The agent's model client, built by model_client_factory on first access if needed."""
+        if self._model_client is None:
+            self._model_client = self._model_client_factory()  # type: ignore[misc]
+        return self._model_client
+
+    @model_client.setter
+    def model_client(self, value: BaseChatCompletionClient) -> None:
+        self._model_client = value
+
+    @property
+    def model_name(self) -> Optional[str]:
+        """Model name of the client, or None if a deferred client has not been built yet."""
+        if self._model_client is None:
+            return None
+        return getattr(self._model_client, "model", None)
+
     def _process_tools(self, tools: List[Union[BaseTool, Callable]]) -> List[BaseTool]:
         """
         Convert mixed tool types to BaseTool instances.
@@ -299,7 +326,7 @@ class BaseAgent(ComponentBase[BaseModel], ABC):
             "name": self.name,
             "description": self.description,
             "type": self.__class__.__name__,
-            "model": getattr(self.model_client, "model", "unknown"),
+            "model": self.model_name or "unknown",
             "tools_count": len(self.tools),
             "has_memory": self.memory is not None,
             "has_middlewares": len(self.middleware_chain.middlewares) > 0,
@@ -25,6 +25,7 @@ from ._playwright_tools import (
     ClickTool,
     NavigateTool,
     ObservePageTool,
+    ReadPagesTool,
     ScrollTool,
     TypeTool,
     create_playwright_tools,
@@ -45,6 +46,7 @@ __all__ = [
     "DOMFilter",
     # Tools
     "NavigateTool",
+    "ReadPagesTool",
     "ClickTool",
     "TypeTool",
     "ScrollTool",
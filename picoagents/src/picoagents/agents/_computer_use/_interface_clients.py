@@ -5,6 +5,7 @@ This module provides base classes and implementations for different
 interface automation backends (Playwright for web, PyAutoGUI for desktop, etc).
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -393,6 +394,51 @@ class PlaywrightWebClient(BaseInterfaceClient):
 
         return await self.page.screenshot(type="png")
 
+    async def fetch_many(self, urls: List[str], max_chars: int = 5000) -> List[str]:
+        """
+        Load several pages concurrently and return their main text.
+
+        Each URL opens in its own tab of the current browser context, so the
+        page the agent is working on is left untouched.
+
+        Args:
+            urls: URLs to read
+            max_chars: Maximum characters of text to keep per page
+
+        Returns:
+            Text for each URL in input order (an "Error: ..." string for failures)
+        """
+        if not self.context:
+            raise RuntimeError("Browser not initialized. Call initialize() first.")
+
+        async def fetch(url: str) -> str:
+            page = await self.context.new_page()
+            try:
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                # Prefer the article/main region, like observe_page does
+                return await page.evaluate(
+                    """(maxChars) => {
+                        const main = document.querySelector('article, main, [role="main"]');
+                        return (main || document.body).innerText.substring(0, maxChars);
+                    }""",
+                    max_chars,
+                )
+            finally:
+                await page.close()
+
+        results = await asyncio.gather(
+            *(fetch(url) for url in urls), return_exceptions=True
+        )
+        pages: List[str] = []
+        for result in results:
+            # A cancelled fetch means the whole read was cancelled, not a failed page
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            pages.append(
+                f"Error: {result}" if isinstance(result, BaseException) else result
+            )
+        return pages
+
     async def close(self) -> None:
         """Close browser and clean up."""
         if self.page:
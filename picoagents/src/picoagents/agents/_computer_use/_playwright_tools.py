@@ -37,6 +37,42 @@ class NavigateTool(BaseTool):
         )
 
 
+class ReadPagesTool(BaseTool):
+    """Read several pages in parallel without leaving the current page."""
+
+    def __init__(self, interface_client):
+        super().__init__(
+            name="read_pages",
+            description="Read the main text of several URLs at once (e.g. the top articles from a listing) without leaving the current page",
+        )
+        self.interface_client = interface_client
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "properties": {
+                "urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "The URLs to read",
+                }
+            },
+            "required": ["urls"],
+        }
+
+    async def execute(self, parameters: Dict[str, Any]) -> ToolResult:
+        urls = parameters["urls"]
+        try:
+            texts = await self.interface_client.fetch_many(urls)
+        except Exception as e:
+            return ToolResult(success=False, result="", error=str(e))
+        result = "\n\n".join(
+            f"--- {url} ---\n{text}" for url, text in zip(urls, texts)
+        )
+        return ToolResult(success=True, result=result, error=None)
+
+
 class ClickTool(BaseTool):
     """Click on an element."""
 
@@ -356,7 +392,7 @@ def create_playwright_tools(interface_client) -> list[BaseTool]:
     Returns:
         List of tool instances
     """
-    return [
+    tools: list[BaseTool] = [
         NavigateTool(interface_client),
         ClickTool(interface_client),
         TypeTool(interface_client),
@@ -366,3 +402,7 @@ def create_playwright_tools(interface_client) -> list[BaseTool]:
         ScrollTool(interface_client),
         ObservePageTool(interface_client),
     ]
+    # Parallel reads need a client that can open extra pages
+    if hasattr(interface_client, "fetch_many"):
+        tools.insert(1, ReadPagesTool(interface_client))
+    return tools
@@ -4,10 +4,9 @@ Basic evaluation example for picoagents.
 This example demonstrates how to evaluate different components using the new evaluation system.
 """
 
-import asyncio
 import os
 
-from picoagents import Agent, OpenAIChatCompletionClient
+from picoagents import Agent, OpenAIChatCompletionClient, run
 from picoagents.eval import AgentEvalTarget, EvalRunner, LLMEvalJudge, ModelEvalTarget
 from picoagents.types import EvalTask
 
@@ -160,4 +159,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -7,7 +7,7 @@ anthropic>=0.73.0 client library.
 
 import json
 import time
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type
+from typing import Any, AsyncGenerator, Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel
 
@@ -44,6 +44,7 @@ class AnthropicChatCompletionClientConfig(BaseModel):
     model: str = "claude-sonnet-4-5"  # Sonnet supports structured outputs
     api_key: Optional[str] = None
     base_url: Optional[str] = None
+    prompt_caching: bool = False
     config: Dict[str, Any] = {}
 
 
@@ -66,6 +67,7 @@ class AnthropicChatCompletionClient(
         model: str = "claude-sonnet-4-5",
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
+        prompt_caching: bool = False,
         **kwargs: Any,
     ):
         """
@@ -76,9 +78,12 @@ class AnthropicChatCompletionClient(
                    Note: Only Sonnet 4.5 and Opus 4.1 support structured outputs
             api_key: Anthropic API key (will use ANTHROPIC_API_KEY env var if not provided)
             base_url: Custom base URL for API calls
+            prompt_caching: Mark the system prompt as a cache breakpoint so repeated calls
+                (e.g. each tool-loop iteration) reuse the cached tools + system prefix
             **kwargs: Additional Anthropic client configuration
         """
         super().__init__(model, api_key, **kwargs)
+        self.prompt_caching = prompt_caching
 
         self.client = AsyncAnthropic(
             api_key=api_key, base_url=base_url, **kwargs
@@ -124,7 +129,7 @@ class AnthropicChatCompletionClient(
 
             # Add system message if present
             if system_message:
-                request_params["system"] = system_message
+                request_params["system"] = self._system_param(system_message)
 
             # Add temperature if provided
             if "temperature" in kwargs:
@@ -267,7 +272,7 @@ class AnthropicChatCompletionClient(
             }
 
             if system_message:
-                request_params["system"] = system_message
+                request_params["system"] = self._system_param(system_message)
 
             if "temperature" in kwargs:
                 request_params["temperature"] = kwargs["temperature"]
@@ -277,7 +282,6 @@ class AnthropicChatCompletionClient(
 
             # Create stream using context manager
             async with self.client.messages.stream(**request_params) as stream:
-                accumulated_content = ""
                 tool_call_chunks = {}
 
                 async for event in stream:
@@ -285,7 +289,6 @@ class AnthropicChatCompletionClient(
                     if event.type == "content_block_delta":
                         if hasattr(event.delta, "text"):
                             # Text content chunk
-                            accumulated_content += event.delta.text
                             yield ChatCompletionChunk(
                                 content=event.delta.text,
                                 is_complete=False,
@@ -447,6 +450,30 @@ class AnthropicChatCompletionClient(
 
         return api_messages
 
+    def _system_param(self, system_message: str) -> Union[str, List[Dict[str, Any]]]:
+        """
+        Build the system parameter, adding a cache breakpoint when prompt caching is on.
+
+        Anthropic caches the prompt prefix in order tools -> system -> messages, so a
+        breakpoint on the system block covers the tool definitions as well. Prefixes
+        below the model's minimum cacheable length are simply not cached.
+
+        Args:
+            system_message: System prompt text
+
+        Returns:
+            Plain string, or a single cached text block
+        """
+        if not self.prompt_caching:
+            return system_message
+        return [
+            {
+                "type": "text",
+                "text": system_message,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
     def _convert_tools_to_anthropic_format(
         self, tools: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -548,6 +575,7 @@ class AnthropicChatCompletionClient(
             model=self.model,
             api_key=self.api_key,
             base_url=str(base_url) if base_url else None,
+            prompt_caching=self.prompt_caching,
             config=self.config,
         )
 
@@ -564,5 +592,6 @@ class AnthropicChatCompletionClient(
             model=config.model,
             api_key=config.api_key,
             base_url=config.base_url,
+            prompt_caching=config.prompt_caching,
             **config.config,
         )
\ No newline at end of file
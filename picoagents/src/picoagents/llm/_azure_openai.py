@@ -300,7 +300,6 @@ class AzureOpenAIChatCompletionClient(
             # Make streaming API call
             stream = await self.client.chat.completions.create(**request_params)
 
-            accumulated_content = ""
             tool_call_chunks = {}
 
             async for chunk in stream:
@@ -330,7 +329,6 @@ class AzureOpenAIChatCompletionClient(
 
                 # Handle content chunks
                 if delta.content:
-                    accumulated_content += delta.content
                     yield ChatCompletionChunk(
                         content=delta.content, is_complete=False, tool_call_chunk=None
                     )
@@ -5,9 +5,12 @@ This module defines the interface that all LLM providers must implement,
 providing a unified way to interact with different language models.
 """
 
+import asyncio
+import contextlib
 import json
+import os
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Type
 
 from pydantic import BaseModel
 
@@ -15,6 +18,8 @@ from .._component_config import ComponentBase
 from ..messages import Message
 from ..types import ChatCompletionChunk, ChatCompletionResult
 
+_STREAM_END = object()
+
 
 class BaseChatCompletionClient(ComponentBase[BaseModel], ABC):
     """
@@ -173,6 +178,111 @@ class BaseChatCompletionClient(ComponentBase[BaseModel], ABC):
         return api_messages
 
 
+async def batch_stream_chunks(
+    chunks: AsyncIterator[ChatCompletionChunk],
+    min_size: Optional[int] = None,
+    max_size: Optional[int] = None,
+    growth: Optional[float] = None,
+    max_delay: float = 0.015,
+) -> AsyncGenerator[ChatCompletionChunk, None]:
+    """
+    Coalesce text-only stream chunks into growing batches.
+
+    The first batch holds min_size deltas so the first token still arrives
+    immediately; each later batch is growth times larger, up to max_size.
+    Buffered text is never held longer than max_delay seconds, and any
+    tool call or final chunk flushes the buffer before it is passed through.
+
+    Defaults come from PICOAGENTS_STREAM_BATCH_MIN (1), PICOAGENTS_STREAM_BATCH_MAX
+    (1, i.e. batching off) and PICOAGENTS_STREAM_BATCH_GROWTH (3).
+
+    Args:
+        chunks: Chunk stream from a client's create_stream()
+        min_size: Deltas in the first batch
+        max_size: Largest batch size in deltas (1 disables batching)
+        growth: Factor applied to the batch size after each flush
+        max_delay: Longest time buffered text may wait for more deltas
+
+    Yields:
+        ChatCompletionChunk objects, with consecutive text deltas merged
+    """
+    if min_size is None:
+        min_size = int(os.getenv("PICOAGENTS_STREAM_BATCH_MIN", "1"))
+    if max_size is None:
+        max_size = int(os.getenv("PICOAGENTS_STREAM_BATCH_MAX", "1"))
+    if growth is None:
+        growth = float(os.getenv("PICOAGENTS_STREAM_BATCH_GROWTH", "3"))
+
+    if max_size <= 1:
+        async for chunk in chunks:
+            yield chunk
+        return
+
+    loop = asyncio.get_running_loop()
+    pending: List[str] = []
+    batch_size = max(1, min(min_size, max_size))
+    last_flush = loop.time()
+
+    def flush() -> ChatCompletionChunk:
+        nonlocal batch_size, last_flush
+        merged = ChatCompletionChunk(
+            content="".join(pending), is_complete=False, tool_call_chunk=None, usage=None
+        )
+        pending.clear()
+        batch_size = min(max(batch_size + 1, int(batch_size * growth)), max_size)
+        last_flush = loop.time()
+        return merged
+
+    # Provider streams (httpx/anyio) must be iterated from a single task, so one
+    # producer task reads the stream and hands chunks over through a queue
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max_size)
+
+    async def produce() -> None:
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            # Wait for the next delta, but not past the buffered text's deadline
+            timeout = None
+            if pending:
+                timeout = max(0.0, last_flush + max_delay - loop.time())
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield flush()
+                continue
+
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            chunk = item
+            if chunk.content and not chunk.is_complete and not chunk.tool_call_chunk:
+                pending.append(chunk.content)
+                if len(pending) >= batch_size:
+                    yield flush()
+                continue
+
+            if pending:
+                yield flush()
+            yield chunk
+
+        if pending:
+            yield flush()
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
 class BaseChatCompletionError(Exception):
     """Raised when a chat completion API call fails."""
 
@@ -282,7 +282,6 @@ class OpenAIChatCompletionClient(
             # Make streaming API call
             stream = await self.client.chat.completions.create(**request_params)
 
-            accumulated_content = ""
             tool_call_chunks = {}
 
             async for chunk in stream:
@@ -312,7 +311,6 @@ class OpenAIChatCompletionClient(
 
                 # Handle content chunks
                 if delta.content:
-                    accumulated_content += delta.content
                     yield ChatCompletionChunk(
                         content=delta.content, is_complete=False, tool_call_chunk=None
                     )
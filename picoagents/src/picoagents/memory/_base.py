@@ -12,8 +12,10 @@ Licensed under MIT License
 import json
 import os
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -74,6 +76,16 @@ class BaseMemory(ComponentBase[BaseModel], ABC):
         """
         pass
 
+    async def add_many(self, contents: List[MemoryContent]) -> None:
+        """
+        Store several items; backends that can batch (e.g. embeddings) override this.
+
+        Args:
+            contents: MemoryContent objects to store, oldest first
+        """
+        for content in contents:
+            await self.add(content)
+
     @abstractmethod
     async def query(self, query: str, limit: int = 10) -> MemoryQueryResult:
         """
@@ -142,16 +154,13 @@ class ListMemory(Component[ListMemoryConfig], BaseMemory):
 
     def __init__(self, max_memories: int = 1000):
         super().__init__(max_memories)
-        self.memories: List[MemoryContent] = []
+        # Bounded deque: appending at capacity drops the oldest memory in O(1)
+        self.memories: Deque[MemoryContent] = deque(maxlen=max_memories)
 
     async def add(self, content: MemoryContent) -> None:
         """Store new content in memory list."""
         self.memories.append(content)
 
-        # Remove oldest memories if we exceed capacity
-        if len(self.memories) > self.max_memories:
-            self.memories = self.memories[-self.max_memories :]
-
     async def query(self, query: str, limit: int = 10) -> MemoryQueryResult:
         """Retrieve memories using simple text matching."""
         query_lower = query.lower()
@@ -172,7 +181,9 @@ class ListMemory(Component[ListMemoryConfig], BaseMemory):
 
     async def get_context(self, max_items: int = 10) -> MemoryQueryResult:
         """Get most recent memories as context."""
-        recent_memories = self.memories[-max_items:] if self.memories else []
+        # Walk back from the newest entry only as far as needed, then restore order
+        recent_memories = list(islice(reversed(self.memories), max_items))
+        recent_memories.reverse()
         return MemoryQueryResult(results=recent_memories)
 
     async def clear(self) -> None:
@@ -199,9 +210,9 @@ class ListMemory(Component[ListMemoryConfig], BaseMemory):
     def _from_config(cls, config: ListMemoryConfig) -> "ListMemory":
         """Create from configuration."""
         instance = cls(max_memories=config.max_memories)
-        instance.memories = [
+        instance.memories.extend(
             MemoryContent(**memory_data) for memory_data in config.memories
-        ]
+        )
         return instance
 
 
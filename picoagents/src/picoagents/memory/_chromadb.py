@@ -10,7 +10,7 @@ import json
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -118,12 +118,15 @@ class ChromaDBMemory(Component[ChromaDBMemoryConfig], BaseMemory):
             name=collection_name, metadata=metadata
         )
 
-    async def add(self, content: MemoryContent) -> None:
+    def _to_record(self, content: MemoryContent) -> Tuple[str, Dict[str, Any]]:
         """
-        Store new content in vector memory.
+        Convert a memory item to the (document, metadata) pair ChromaDB stores.
 
         Args:
-            content: MemoryContent object to store
+            content: MemoryContent object to convert
+
+        Returns:
+            Document text to embed and its metadata
         """
         # Convert content to string for embedding
         if isinstance(content.content, str):
@@ -138,10 +141,38 @@ class ChromaDBMemory(Component[ChromaDBMemoryConfig], BaseMemory):
         metadata.update(
             {"timestamp": content.timestamp.isoformat(), "mime_type": content.mime_type}
         )
+        return document, metadata
+
+    async def add(self, content: MemoryContent) -> None:
+        """
+        Store new content in vector memory.
+
+        Args:
+            content: MemoryContent object to store
+        """
+        await self.add_many([content])
+
+    async def add_many(self, contents: List[MemoryContent]) -> None:
+        """
+        Store several items with a single collection insert.
+
+        ChromaDB embeds all documents of one add() call together, so this costs
+        one embedding batch instead of one per item.
+
+        Args:
+            contents: MemoryContent objects to store
+        """
+        if not contents:
+            return
+
+        documents, metadatas = zip(*(self._to_record(content) for content in contents))
 
         # Add to ChromaDB collection
-        memory_id = str(uuid.uuid4())
-        self.collection.add(documents=[document], metadatas=[metadata], ids=[memory_id])
+        self.collection.add(
+            documents=list(documents),
+            metadatas=list(metadatas),
+            ids=[str(uuid.uuid4()) for _ in contents],
+        )
 
         # Enforce max_memories limit
         await self._enforce_memory_limit()
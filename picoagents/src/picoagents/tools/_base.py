@@ -5,6 +5,7 @@ This module defines the abstract base classes and core functionality
 for tools that agents can use to interact with the world.
 """
 
+import asyncio
 import inspect
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
@@ -218,6 +219,7 @@ class FunctionTool(BaseTool):
         description: Optional[str] = None,
         version: str = "1.0.0",
         approval_mode: ApprovalMode = ApprovalMode.NEVER,
+        run_in_thread: bool = False,
     ):
         """
         Create a tool from a Python function.
@@ -228,8 +230,12 @@ class FunctionTool(BaseTool):
             description: Optional custom description (defaults to function docstring)
             version: Tool version following semantic versioning (default: "1.0.0")
             approval_mode: Whether approval is required before execution
+            run_in_thread: Run a sync function in a worker thread so blocking calls
+                don't stall the event loop. Leave off for functions that use
+                thread-affine state (e.g. sqlite connections) or expect the loop thread.
         """
         self.func = func
+        self.run_in_thread = run_in_thread
         tool_name = name or func.__name__
         tool_description = (
             description or func.__doc__ or f"Execute {func.__name__} function"
@@ -280,9 +286,12 @@ class FunctionTool(BaseTool):
                     metadata={"tool_name": self.name},
                 )
 
-            # Execute function
+            # Execute function (async or sync); opted-in sync functions run in a
+            # worker thread so a blocking call doesn't stall the event loop
             if inspect.iscoroutinefunction(self.func):
                 result = await self.func(**parameters)
+            elif self.run_in_thread:
+                result = await asyncio.to_thread(self.func, **parameters)
             else:
                 result = self.func(**parameters)
 
@@ -8,6 +8,7 @@ and perform common development operations with workspace isolation.
 import asyncio
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence
 
@@ -15,6 +16,17 @@ from ..types import ToolResult
 from ._base import BaseTool
 
 
+@lru_cache(maxsize=128)
+def _workspace_root(workspace: Path) -> str:
+    """Resolved workspace path used for access checks, computed once per workspace.
+
+    Resolving walks every component of the path with a filesystem call, and the
+    workspace root doesn't change between tool calls. Callers pass an absolute
+    path so a relative workspace is still tied to the current directory.
+    """
+    return str(workspace.resolve())
+
+
 class ReadFileTool(BaseTool):
     """Read content from a file."""
 
@@ -49,7 +61,7 @@ class ReadFileTool(BaseTool):
         try:
             full_path = (self.workspace / file_path).resolve()
 
-            if not str(full_path).startswith(str(self.workspace.resolve())):
+            if not str(full_path).startswith(_workspace_root(self.workspace.absolute())):
                 raise ValueError("Access denied: path outside workspace")
 
             if not full_path.exists():
@@ -145,7 +157,7 @@ class WriteFileTool(BaseTool):
         try:
             full_path = (self.workspace / file_path).resolve()
 
-            if not str(full_path).startswith(str(self.workspace.resolve())):
+            if not str(full_path).startswith(_workspace_root(self.workspace.absolute())):
                 raise ValueError("Access denied: path outside workspace")
 
             full_path.parent.mkdir(parents=True, exist_ok=True)
@@ -286,7 +298,7 @@ class ListDirectoryTool(BaseTool):
         try:
             full_path = (self.workspace / directory_path).resolve()
 
-            if not str(full_path).startswith(str(self.workspace.resolve())):
+            if not str(full_path).startswith(_workspace_root(self.workspace.absolute())):
                 raise ValueError("Access denied: path outside workspace")
 
             if not full_path.exists():
@@ -379,7 +391,7 @@ class GrepSearchTool(BaseTool):
         try:
             full_path = (self.workspace / path).resolve()
 
-            if not str(full_path).startswith(str(self.workspace.resolve())):
+            if not str(full_path).startswith(_workspace_root(self.workspace.absolute())):
                 raise ValueError("Access denied: path outside workspace")
 
             cmd = ["rg", "--json"]
@@ -16,6 +16,7 @@ def tool(
     name: Optional[str] = None,
     description: Optional[str] = None,
     approval_mode: Union[str, ApprovalMode] = "never_require",
+    run_in_thread: bool = False,
 ) -> Union[FunctionTool, Callable[[Callable[..., T]], FunctionTool]]:
     """
     Decorator to create a tool from a function with approval support.
@@ -25,6 +26,7 @@ def tool(
         name: Tool name (defaults to function name)
         description: Tool description (defaults to docstring)
         approval_mode: When to require approval ("always_require" or "never_require")
+        run_in_thread: Run a sync function in a worker thread instead of on the event loop
 
     Returns:
         FunctionTool or decorator function
@@ -43,6 +45,11 @@ def tool(
             os.remove(path)
             return f"Deleted {path}"
 
+        # Blocking I/O, run off the event loop
+        @tool(run_in_thread=True)
+        def fetch_page(url: str) -> str:
+            return requests.get(url).text
+
         # With custom name
         @tool(name="weather_tool", description="Gets weather info")
         def my_weather_func(city: str) -> str:
@@ -65,6 +72,7 @@ def tool(
             name=tool_name,
             description=tool_desc,
             approval_mode=mode,
+            run_in_thread=run_in_thread,
         )
 
     # If func is provided, we're being used without parentheses
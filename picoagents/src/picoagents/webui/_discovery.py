@@ -476,7 +476,11 @@ class PicoAgentsScanner:
             AgentInfo instance
         """
         tools = self._extract_agent_tools(agent)
-        model = getattr(getattr(agent, "model_client", None), "model", None)
+        # model_name doesn't force a deferred model client to be built during discovery
+        if hasattr(agent, "model_name"):
+            model = agent.model_name
+        else:
+            model = getattr(getattr(agent, "model_client", None), "model", None)
         memory_type = (
             type(getattr(agent, "memory", None)).__name__
             if getattr(agent, "memory", None)
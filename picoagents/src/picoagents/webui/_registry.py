@@ -259,9 +259,7 @@ class EntityRegistry:
                     getattr(tool, "name", str(tool))
                     for tool in getattr(entity_obj, "tools", [])
                 ]
-                model = getattr(
-                    getattr(entity_obj, "model_client", None), "model", None
-                )
+                model = entity_obj.model_name
                 memory_type = (
                     type(getattr(entity_obj, "memory", None)).__name__
                     if getattr(entity_obj, "memory", None)
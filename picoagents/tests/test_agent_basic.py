@@ -101,6 +101,43 @@ async def test_agent_initialization():
     assert agent.max_iterations == 10
 
 
+@pytest.mark.asyncio
+async def test_agent_model_client_factory_is_lazy():
+    """Test that a model_client_factory is only called on first use, and only once."""
+    built: List[MockChatCompletionClient] = []
+
+    def factory() -> MockChatCompletionClient:
+        built.append(MockChatCompletionClient())
+        return built[-1]
+
+    agent = Agent(
+        name="test-agent",
+        description="A test agent",
+        instructions="You are helpful",
+        model_client_factory=factory,
+    )
+
+    assert built == []
+    assert agent.model_name is None
+    assert agent.get_info()["model"] == "unknown"
+
+    await agent.run("Hello")
+    await agent.run("Hello again")
+
+    assert len(built) == 1
+    assert agent.model_client is built[0]
+    assert built[0].call_count == 2
+    assert agent.model_name == "test-model"
+
+
+def test_agent_requires_model_client_or_factory():
+    """Test that an agent without a client or factory is rejected."""
+    from picoagents.agents import AgentConfigurationError
+
+    with pytest.raises(AgentConfigurationError):
+        Agent(name="test-agent", description="A test agent", instructions="You are helpful")
+
+
 @pytest.mark.asyncio
 async def test_agent_run_basic():
     """Test basic agent.run() functionality."""
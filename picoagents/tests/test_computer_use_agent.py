@@ -5,7 +5,8 @@ This module tests the basic functionality of ComputerUseAgent
 and the as_tool() method for agent composition.
 """
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -16,6 +17,7 @@ from picoagents.agents._computer_use._interface_clients import (
     ActionType,
     BaseInterfaceClient,
     InterfaceState,
+    PlaywrightWebClient,
 )
 from picoagents.llm import BaseChatCompletionClient
 
@@ -162,3 +164,72 @@ def test_computer_use_agent_configuration():
     assert agent.description == "Custom computer use agent"
     assert not agent.use_screenshots
     assert agent.max_iterations == 5
+
+
+@pytest.mark.asyncio
+async def test_read_pages_tool():
+    """Test that clients with fetch_many get the parallel read_pages tool."""
+
+    class MockMultiPageClient(MockInterfaceClient):
+        async def fetch_many(self, urls, max_chars: int = 5000):
+            return [f"text of {url}" for url in urls]
+
+    agent = ComputerUseAgent(
+        interface_client=MockMultiPageClient(),
+        model_client=MockModelClient(),
+    )
+    tool = agent._find_tool("read_pages")
+    assert tool is not None
+    assert "read_pages" in agent.instructions
+
+    result = await tool.execute({"urls": ["https://a.example", "https://b.example"]})
+    assert result.success
+    assert "--- https://a.example ---\ntext of https://a.example" in result.result
+    assert "text of https://b.example" in result.result
+
+    # Clients without fetch_many don't get the tool
+    plain_agent = ComputerUseAgent(
+        interface_client=MockInterfaceClient(),
+        model_client=MockModelClient(),
+    )
+    assert plain_agent._find_tool("read_pages") is None
+
+
+def _client_with_pages(goto_errors):
+    """PlaywrightWebClient whose tabs fail goto() with the given error per URL."""
+
+    def new_page():
+        page = MagicMock()
+        page.close = AsyncMock()
+
+        async def goto(url, **kwargs):
+            if url in goto_errors:
+                raise goto_errors[url]
+
+        page.goto = goto
+        page.evaluate = AsyncMock(return_value="page text")
+        return page
+
+    client = PlaywrightWebClient()
+    client.context = MagicMock()
+    client.context.new_page = AsyncMock(side_effect=new_page)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_reports_failed_pages():
+    """Test that a failing page becomes an error string without affecting the others."""
+    client = _client_with_pages({"https://bad.example": ValueError("net::ERR")})
+
+    results = await client.fetch_many(["https://ok.example", "https://bad.example"])
+
+    assert results == ["page text", "Error: net::ERR"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_propagates_cancellation():
+    """Test that a cancelled page fetch is re-raised, not returned as page text."""
+    client = _client_with_pages({"https://slow.example": asyncio.CancelledError()})
+
+    with pytest.raises(asyncio.CancelledError):
+        await client.fetch_many(["https://ok.example", "https://slow.example"])
@@ -7,6 +7,7 @@ This module tests various LLM client implementations including:
 - Anthropic
 """
 
+import asyncio
 import os
 from typing import List
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -20,6 +21,7 @@ from picoagents.llm import (
     BaseChatCompletionClient,
     OpenAIChatCompletionClient,
 )
+from picoagents.llm._base import batch_stream_chunks
 from picoagents.messages import (
     AssistantMessage,
     SystemMessage,
@@ -27,6 +29,7 @@ from picoagents.messages import (
     ToolMessage,
     UserMessage,
 )
+from picoagents.types import ChatCompletionChunk
 
 
 class TestOutput(BaseModel):
@@ -258,6 +261,45 @@ class TestModelClients:
             assert result.usage.tokens_input == 10
             assert result.usage.tokens_output == 5
 
+    @pytest.mark.asyncio
+    async def test_anthropic_prompt_caching_marks_system_prompt(self, messages):
+        """Test that prompt_caching sends the system prompt as a cached block."""
+        with patch('picoagents.llm._anthropic.AsyncAnthropic') as MockAnthropic:
+            mock_client = AsyncMock()
+            MockAnthropic.return_value = mock_client
+
+            mock_text_block = MagicMock()
+            mock_text_block.text = "Hello! I'm Claude."
+
+            mock_response = MagicMock()
+            mock_response.content = [mock_text_block]
+            mock_response.model = "claude-3-5-sonnet-20241022"
+            mock_response.stop_reason = "end_turn"
+            mock_response.usage.input_tokens = 10
+            mock_response.usage.output_tokens = 5
+
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
+
+            client = AnthropicChatCompletionClient(
+                model="claude-3-5-sonnet-20241022",
+                api_key="test",
+                prompt_caching=True
+            )
+            await client.create(messages)
+
+            system = mock_client.messages.create.call_args.kwargs["system"]
+            assert system == [
+                {
+                    "type": "text",
+                    "text": "You are a helpful assistant",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+
+            # Setting survives serialization
+            restored = AnthropicChatCompletionClient._from_config(client._to_config())
+            assert restored.prompt_caching is True
+
     def test_serialization_configs(self):
         """Test that all clients can be serialized to config."""
         # OpenAI
@@ -354,6 +396,87 @@ class TestModelClients:
         assert cost > 0
 
 
+class TestStreamBatching:
+    """Test coalescing of streamed text deltas."""
+
+    @staticmethod
+    async def _stream(items, delay: float = 0.0):
+        for item in items:
+            if delay:
+                await asyncio.sleep(delay)
+            yield item
+
+    @staticmethod
+    def _text(content: str) -> ChatCompletionChunk:
+        return ChatCompletionChunk(content=content, is_complete=False)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        """Test that chunks pass through unchanged when batching is off."""
+        chunks = [self._text(c) for c in "abc"]
+        result = [c async for c in batch_stream_chunks(self._stream(chunks))]
+        assert result == chunks
+
+    @pytest.mark.asyncio
+    async def test_batches_grow_and_flush_before_other_chunks(self):
+        """Test growing batch sizes and flushing ahead of tool/final chunks."""
+        tool_chunk = ChatCompletionChunk(
+            content="", is_complete=False, tool_call_chunk={"id": "call_1"}
+        )
+        final_chunk = ChatCompletionChunk(content="", is_complete=True)
+        chunks = [self._text(c) for c in "abcdefghij"] + [tool_chunk, final_chunk]
+
+        result = [
+            c
+            async for c in batch_stream_chunks(
+                self._stream(chunks), min_size=1, max_size=4, growth=2, max_delay=10
+            )
+        ]
+
+        assert [c.content for c in result[:-2]] == ["a", "bc", "defg", "hij"]
+        assert result[-2] is tool_chunk
+        assert result[-1] is final_chunk
+
+    @pytest.mark.asyncio
+    async def test_pause_flushes_buffered_text(self):
+        """Test that buffered text is not held back while the stream is idle."""
+        chunks = [self._text(c) for c in "abc"]
+        result = [
+            c.content
+            async for c in batch_stream_chunks(
+                self._stream(chunks, delay=0.05),
+                min_size=10,
+                max_size=10,
+                max_delay=0.01,
+            )
+        ]
+        assert result == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_stream_is_read_from_one_task(self):
+        """Test that the underlying stream is never iterated across tasks."""
+        tasks = set()
+
+        async def stream():
+            for c in "abcdef":
+                tasks.add(asyncio.current_task())
+                await asyncio.sleep(0.005)
+                yield self._text(c)
+            tasks.add(asyncio.current_task())
+            await asyncio.sleep(0.005)
+            raise RuntimeError("stream failed")
+
+        result = []
+        with pytest.raises(RuntimeError, match="stream failed"):
+            async for c in batch_stream_chunks(
+                stream(), min_size=1, max_size=4, max_delay=0.001
+            ):
+                result.append(c.content)
+
+        assert "".join(result) == "abcdef"
+        assert len(tasks) == 1
+
+
 @pytest.mark.skipif(
     not os.getenv("OPENAI_API_KEY"),
     reason="OPENAI_API_KEY not set"
@@ -0,0 +1,72 @@
+"""
+Tests for the shared event loop runner.
+"""
+
+import asyncio
+
+import pytest
+
+from picoagents import print_stream, run
+
+
+async def _current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def test_run_returns_result():
+    async def add(a: int, b: int) -> int:
+        await asyncio.sleep(0)
+        return a + b
+
+    assert run(add(2, 3)) == 5
+
+
+def test_run_reuses_event_loop():
+    first = run(_current_loop())
+    second = run(_current_loop())
+    assert first is second
+    assert not first.is_closed()
+
+
+def test_run_uses_uvloop_when_installed():
+    uvloop = pytest.importorskip("uvloop")
+    assert isinstance(run(_current_loop()), uvloop.Loop)
+
+
+async def _events(n: int, fail: bool = False):
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield f"event {i}"
+    if fail:
+        raise RuntimeError("stream failed")
+
+
+@pytest.mark.asyncio
+async def test_print_stream_prints_every_item_in_order(capsys):
+    await print_stream(_events(100), maxsize=4)
+    assert capsys.readouterr().out.splitlines() == [f"event {i}" for i in range(100)]
+
+
+@pytest.mark.asyncio
+async def test_print_stream_reraises_stream_errors(capsys):
+    with pytest.raises(RuntimeError, match="stream failed"):
+        await print_stream(_events(3, fail=True))
+    assert capsys.readouterr().out.splitlines() == ["event 0", "event 1", "event 2"]
+
+
+@pytest.mark.asyncio
+async def test_print_stream_cancelled_with_full_queue_leaves_no_task(capsys):
+    async def endless():
+        i = 0
+        while True:
+            yield f"event {i}"
+            i += 1
+
+    printer = asyncio.create_task(print_stream(endless(), maxsize=2))
+    await asyncio.sleep(0.05)
+    printer.cancel()
+    done, _ = await asyncio.wait({printer}, timeout=1)
+    assert printer in done and printer.cancelled()
+
+    await asyncio.sleep(0)
+    assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -8,7 +8,7 @@ import pytest
 
 from picoagents.agents import Agent
 from picoagents.llm import OpenAIChatCompletionClient
-from picoagents.memory import FileMemory, ListMemory
+from picoagents.memory import FileMemory, ListMemory, MemoryContent
 from picoagents.orchestration import AIOrchestrator, RoundRobinOrchestrator
 from picoagents.termination import (
     CompositeTermination,
@@ -43,7 +43,7 @@ def test_memory_serialization():
     loaded_memory = ListMemory.load_component(component_model)
 
     assert loaded_memory.max_memories == 50
-    assert loaded_memory.memories == []  # Should start empty
+    assert list(loaded_memory.memories) == []  # Should start empty
 
     # Test FileMemory
     file_memory = FileMemory("test.json", max_memories=100)
@@ -54,6 +54,22 @@ def test_memory_serialization():
     assert loaded_file_memory.max_memories == 100
 
 
+@pytest.mark.asyncio
+async def test_list_memory_capacity_roundtrip():
+    """Test that ListMemory evicts the oldest entries and keeps order through a roundtrip."""
+    list_memory = ListMemory(max_memories=3)
+    for i in range(5):
+        await list_memory.add(MemoryContent(content=f"fact {i}"))
+
+    assert [m.content for m in list_memory.memories] == ["fact 2", "fact 3", "fact 4"]
+
+    context = await list_memory.get_context(max_items=2)
+    assert [m.content for m in context.results] == ["fact 3", "fact 4"]
+
+    loaded_memory = ListMemory.load_component(list_memory.dump_component())
+    assert [m.content for m in loaded_memory.memories] == ["fact 2", "fact 3", "fact 4"]
+
+
 def test_function_tool_serialization_blocked():
     """Test that FunctionTool serialization is properly blocked."""
 
@@ -510,4 +510,50 @@ async def test_approval_with_function_tool():
     # Should require approval
     response = await agent.run("Execute dangerous operation")
     assert response.needs_approval
-    assert response.approval_requests[0].tool_name == "dangerous_op"
\ No newline at end of file
+    assert response.approval_requests[0].tool_name == "dangerous_op"
+
+@pytest.mark.asyncio
+async def test_approved_tool_calls_resume_in_parallel():
+    """Test that several approved tool calls run concurrently and keep their order."""
+    import time
+
+    @tool(approval_mode="always_require")
+    async def slow_delete(path: str) -> str:
+        """Delete a file slowly."""
+        await asyncio.sleep(0.2)
+        return f"Deleted {path}"
+
+    client = MockChatClientWithTools()
+    client.set_tool_calls(
+        [
+            ToolCallRequest(
+                call_id=f"call_{i}",
+                tool_name="slow_delete",
+                parameters={"path": f"/tmp/file{i}.txt"},
+            )
+            for i in range(3)
+        ]
+    )
+
+    agent = Agent(
+        name="test_agent",
+        description="Test agent",
+        instructions="You are helpful",
+        model_client=client,
+        tools=[slow_delete],
+    )
+
+    response = await agent.run("Delete three files")
+    assert len(response.approval_requests) == 3
+    for approval_req in response.approval_requests:
+        response.context.add_approval_response(
+            approval_req.create_response(approved=True)
+        )
+
+    start = time.perf_counter()
+    response = await agent.run(context=response.context)
+    elapsed = time.perf_counter() - start
+
+    tool_messages = [m for m in response.messages if isinstance(m, ToolMessage)]
+    assert [m.tool_call_id for m in tool_messages] == ["call_0", "call_1", "call_2"]
+    assert elapsed < 0.5
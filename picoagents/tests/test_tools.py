@@ -16,9 +16,9 @@ from typing import Any, AsyncGenerator, Dict, List, Literal, Optional, Type
 import pytest
 from pydantic import BaseModel
 
-from picoagents import Agent, BaseTool, FunctionTool
+from picoagents import Agent, AgentConfigurationError, BaseTool, FunctionTool, tool
 from picoagents.llm import BaseChatCompletionClient
-from picoagents.messages import AssistantMessage
+from picoagents.messages import AssistantMessage, ToolCallRequest, ToolMessage
 from picoagents.tools import create_core_tools
 from picoagents.tools._coding_tools import WriteFileTool
 from picoagents.tools._research_tools import WebFetchTool, WebSearchTool
@@ -372,6 +372,152 @@ async def test_parallel_tool_execution_setup():
     assert "cancellation_token" in param_names
 
 
+@pytest.mark.asyncio
+async def test_parallel_tool_execution_respects_max_parallel_tools():
+    """Test that max_parallel_tools caps how many tool calls run at once."""
+    running = 0
+    peak = 0
+
+    async def slow_lookup(query: str) -> str:
+        """Look something up slowly."""
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"result for {query}"
+
+    agent = Agent(
+        name="test-agent",
+        description="Test agent",
+        instructions="You are a helpful assistant",
+        model_client=MockChatCompletionClient(model="test"),
+        tools=[slow_lookup],
+        max_parallel_tools=2,
+    )
+
+    tool_calls = [
+        ToolCallRequest(
+            tool_name="slow_lookup", parameters={"query": f"q{i}"}, call_id=f"call_{i}"
+        )
+        for i in range(5)
+    ]
+    items = [
+        item async for item in agent._execute_tool_calls_parallel(tool_calls, [])
+    ]
+
+    tool_messages = [item for item in items if isinstance(item, ToolMessage)]
+    assert [m.tool_call_id for m in tool_messages] == [f"call_{i}" for i in range(5)]
+    assert all(m.success for m in tool_messages)
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_function_tool_runs_on_loop_thread_by_default():
+    """Test that sync tools keep running on the event loop thread unless opted in."""
+    import threading
+
+    def current_thread() -> int:
+        """Return the calling thread's id."""
+        return threading.get_ident()
+
+    result = await FunctionTool(current_thread).execute({})
+
+    assert result.success
+    assert result.result == threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_sync_function_tool_does_not_block_event_loop():
+    """Test that a blocking sync tool opted into run_in_thread runs off the event loop."""
+    import threading
+    import time
+
+    loop_thread = threading.get_ident()
+
+    def blocking_lookup(query: str) -> int:
+        """Look something up with a blocking call."""
+        time.sleep(0.05)
+        return threading.get_ident()
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    result = await FunctionTool(blocking_lookup, run_in_thread=True).execute(
+        {"query": "q"}
+    )
+    ticker_task.cancel()
+
+    assert result.success
+    assert result.result != loop_thread
+    assert ticks > 0
+
+
+@pytest.mark.asyncio
+async def test_blocking_tools_opted_into_threads_run_in_parallel():
+    """Test that blocking @tool(run_in_thread=True) calls overlap and leave the loop free."""
+    import time
+
+    @tool(run_in_thread=True)
+    def blocking_lookup(query: str) -> str:
+        """Look something up with a blocking call."""
+        time.sleep(0.1)
+        return f"result for {query}"
+
+    agent = Agent(
+        name="test-agent",
+        description="Test agent",
+        instructions="You are a helpful assistant",
+        model_client=MockChatCompletionClient(model="test"),
+        tools=[blocking_lookup],
+    )
+    tool_calls = [
+        ToolCallRequest(
+            tool_name="blocking_lookup", parameters={"query": f"q{i}"}, call_id=f"call_{i}"
+        )
+        for i in range(3)
+    ]
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    items = [
+        item async for item in agent._execute_tool_calls_parallel(tool_calls, [])
+    ]
+    elapsed = time.perf_counter() - start
+    ticker_task.cancel()
+
+    tool_messages = [item for item in items if isinstance(item, ToolMessage)]
+    assert all(m.success for m in tool_messages)
+    assert elapsed < 0.25  # Three 0.1s calls, run side by side
+    assert ticks >= 5
+
+
+def test_max_parallel_tools_must_be_positive():
+    """Test that a non-positive max_parallel_tools is rejected."""
+    with pytest.raises(AgentConfigurationError):
+        Agent(
+            name="test-agent",
+            description="Test agent",
+            instructions="You are a helpful assistant",
+            model_client=MockChatCompletionClient(model="test"),
+            max_parallel_tools=0,
+        )
+
+
 # ============================================================================
 # Forced Tool Use Tests
 # ============================================================================